@@ -56,6 +56,7 @@ from python_cdo_wrapper.parsers_legacy import (
     ZaxisdesParser,
     get_supported_structured_commands,
     parse_cdo_output,
+    parse_cdo_output_file,
 )
 
 # v1.0.0+ Query API (PRIMARY)
@@ -139,6 +140,7 @@ __all__ = [
     "get_supported_structured_commands",
     "list_operators",
     "parse_cdo_output",
+    "parse_cdo_output_file",
 ]
 
 # Add shapefile utilities to __all__ if available
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, TypeVar
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from ..parsers.base import CDOParser
+
 from ..types.results import (
     GriddesResult,
     InfoResult,
@@ -17,6 +19,19 @@ from ..types.results import (
 )
 from .base import CDOOperator
 
+P = TypeVar("P", bound="CDOParser[Any]")
+
+# The built-in parsers are stateless, so operators share one instance per class
+_PARSERS: dict[type, Any] = {}
+
+
+def _get_parser(parser_class: type[P]) -> P:
+    """Return the shared instance of a built-in parser class."""
+    parser: P | None = _PARSERS.get(parser_class)
+    if parser is None:
+        parser = _PARSERS.setdefault(parser_class, parser_class())
+    return parser
+
 
 class SinfoOperator(CDOOperator[SinfoResult]):
     """sinfo operator - Dataset summary information."""
@@ -49,7 +64,7 @@ class SinfoOperator(CDOOperator[SinfoResult]):
         """
         from ..parsers.info import SinfoParser
 
-        parser = SinfoParser()
+        parser = _get_parser(SinfoParser)
         return parser.parse(output)
 
 
@@ -84,7 +99,7 @@ class InfoOperator(CDOOperator[InfoResult]):
         """
         from ..parsers.info import InfoParser
 
-        parser = InfoParser()
+        parser = _get_parser(InfoParser)
         return parser.parse(output)
 
 
@@ -119,7 +134,7 @@ class GriddesOperator(CDOOperator[GriddesResult]):
         """
         from ..parsers.grid import GriddesParser
 
-        parser = GriddesParser()
+        parser = _get_parser(GriddesParser)
         return parser.parse(output)
 
 
@@ -154,7 +169,7 @@ class ZaxisdesOperator(CDOOperator[ZaxisdesResult]):
         """
         from ..parsers.grid import ZaxisdesParser
 
-        parser = ZaxisdesParser()
+        parser = _get_parser(ZaxisdesParser)
         return parser.parse(output)
 
 
@@ -189,7 +204,7 @@ class VlistOperator(CDOOperator[VlistResult]):
         """
         from ..parsers.info import VlistParser
 
-        parser = VlistParser()
+        parser = _get_parser(VlistParser)
         return parser.parse(output)
 
 
@@ -224,5 +239,5 @@ class PartabOperator(CDOOperator["PartabResult"]):
         """
         from ..parsers.info import PartabParser
 
-        parser = PartabParser()
+        parser = _get_parser(PartabParser)
         return parser.parse(output)
@@ -20,7 +20,7 @@ class CDOParser(ABC, Generic[T]):
         >>> class GriddesParser(CDOParser[GridInfo]):
         ...     def parse(self, output: str) -> GridInfo:
         ...         # Parse griddes output
-        ...         lines = output.strip().split("\\n")
+        ...         lines = output.splitlines()
         ...         # ... parsing logic ...
         ...         return GridInfo(...)
     """
@@ -7,8 +7,18 @@ import re
 from ..exceptions import CDOParseError
 from ..types.grid import GridInfo, ZaxisInfo
 from ..types.results import GriddesResult, ZaxisdesResult
+from ..utils import _intern
 from .base import CDOParser
 
+# Section headers of multi-grid / multi-zaxis output, e.g. "# gridID 1"
+_GRID_SECTION_RE = re.compile(r"#\s*gridID\s+(\d+)")
+_ZAXIS_SECTION_RE = re.compile(r"#\s*zaxisID\s+(\d+)")
+
+# "key = value" attribute lines, skipping comments and trailing "cdo ..." log lines
+_KV_RE = re.compile(
+    r"^[ \t]*(?![#\s]|cdo)([^=\n]*?)[ \t]*=[ \t]*(.*?)[ \t\r]*$", re.MULTILINE
+)
+
 
 class GriddesParser(CDOParser[GriddesResult]):
     """
@@ -52,7 +62,7 @@ class GriddesParser(CDOParser[GriddesResult]):
         grids: list[GridInfo] = []
 
         # Split by grid sections (# gridID N)
-        grid_sections = re.split(r"#\s*gridID\s+(\d+)", output)
+        grid_sections = _GRID_SECTION_RE.split(output)
 
         # Skip first empty section, then process pairs (id, content)
         for i in range(1, len(grid_sections), 2):
@@ -136,30 +146,23 @@ class GriddesParser(CDOParser[GriddesResult]):
             "nvertex",
         }
 
-        for line in content.strip().split("\n"):
-            line = line.strip()
-            if not line or line.startswith("#") or line.startswith("cdo"):
-                continue
-
-            if "=" in line:
-                key, value = line.split("=", 1)
-                key = key.strip()
-                value = value.strip().strip('"')
+        for key, value in _KV_RE.findall(content):
+            value = value.strip('"')
 
-                # Parse and type-convert based on key
-                try:
-                    parsed_value = self._parse_grid_attribute(key, value)
+            # Parse and type-convert based on key
+            try:
+                parsed_value = self._parse_grid_attribute(key, value)
 
-                    # Only add known keys to grid_data, unknown keys go to raw_attributes
-                    if key in known_keys:
-                        grid_data[key] = parsed_value
-                    else:
-                        # Unknown keys stored in raw_attributes for inspection
-                        raw_attrs[key] = parsed_value
+                # Only add known keys to grid_data, unknown keys go to raw_attributes
+                if key in known_keys:
+                    grid_data[key] = parsed_value
+                else:
+                    # Unknown keys stored in raw_attributes for inspection
+                    raw_attrs[key] = parsed_value
 
-                except Exception:
-                    # If parsing fails, store as string in raw_attributes
-                    raw_attrs[key] = value
+            except Exception:
+                # If parsing fails, store as string in raw_attributes
+                raw_attrs[key] = value
 
         # Add raw_attributes if any unrecognized attributes were found
         if raw_attrs:
@@ -198,15 +201,15 @@ class GriddesParser(CDOParser[GriddesResult]):
 
         # Float list fields (space-separated)
         elif key in ["xvals", "yvals", "levels"]:
-            return [float(v) for v in value.split() if v]
+            return list(map(float, value.split()))
 
         # Integer list fields (space-separated)
         elif key == "rowlon":
-            return [int(v) for v in value.split() if v]
+            return list(map(int, value.split()))
 
         # String fields (already stripped of quotes)
         else:
-            return value
+            return _intern(value)
 
 
 class ZaxisdesParser(CDOParser[ZaxisdesResult]):
@@ -232,7 +235,7 @@ class ZaxisdesParser(CDOParser[ZaxisdesResult]):
         zaxes: list[ZaxisInfo] = []
 
         # Split by zaxis sections (# zaxisID N)
-        zaxis_sections = re.split(r"#\s*zaxisID\s+(\d+)", output)
+        zaxis_sections = _ZAXIS_SECTION_RE.split(output)
 
         # Skip first empty section, then process pairs (id, content)
         for i in range(1, len(zaxis_sections), 2):
@@ -263,26 +266,19 @@ class ZaxisdesParser(CDOParser[ZaxisdesResult]):
         """Parse a single zaxis section."""
         zaxis_data: dict[str, str | int | list[float]] = {"zaxis_id": zaxis_id}
 
-        for line in content.strip().split("\n"):
-            line = line.strip()
-            if not line or line.startswith("#") or line.startswith("cdo"):
-                continue
-
-            if "=" in line:
-                key, value = line.split("=", 1)
-                key = key.strip()
-                value = value.strip().strip('"')
-
-                # Convert values based on key
-                if key == "size":
-                    zaxis_data[key] = int(value)
-                elif key in ["levels", "lbounds", "ubounds"]:
-                    # Parse space-separated level values
-                    try:
-                        zaxis_data[key] = [float(v) for v in value.split() if v]
-                    except ValueError:
-                        zaxis_data[key] = []
-                else:
-                    zaxis_data[key] = value
+        for key, value in _KV_RE.findall(content):
+            value = value.strip('"')
+
+            # Convert values based on key
+            if key == "size":
+                zaxis_data[key] = int(value)
+            elif key in ["levels", "lbounds", "ubounds"]:
+                # Parse space-separated level values
+                try:
+                    zaxis_data[key] = list(map(float, value.split()))
+                except ValueError:
+                    zaxis_data[key] = []
+            else:
+                zaxis_data[key] = _intern(value)
 
         return ZaxisInfo(**zaxis_data)  # type: ignore
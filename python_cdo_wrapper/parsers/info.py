@@ -20,8 +20,73 @@ from ..types.variable import (
     VariableInfo,
     VerticalCoordinates,
 )
+from ..utils import _intern
 from .base import CDOParser
 
+# One sinfo variable row:
+# var_id : institut source table_code steptype levels num points num2 dtype : param_id
+_SINFO_VAR_RE = re.compile(
+    r"^[ \t]*(\d+)[ \t]*:"
+    r"[ \t]*(\S+)[ \t]+(\S+)[ \t]+(\S+)[ \t]+(\S+)"
+    r"[ \t]+(\d+)[ \t]+(\d+)[ \t]+(\d+)[ \t]+(\d+)"
+    r"[ \t]+(\S+)[ \t]*:"
+    r"[ \t]*(-?\d+)?[ \t]*$",
+    re.MULTILINE,
+)
+
+# sinfo section headers (matched against left-stripped lines) and their contents
+_SINFO_SECTIONS = (
+    ("-1 : Institut Source", "variables"),
+    ("Grid coordinates", "grid"),
+    ("Vertical coordinates", "vertical"),
+    ("Time coordinate", "time"),
+)
+_SINFO_TRAILER_RE = re.compile(r"cdo\s+sinfo:")
+_FILE_FORMAT_RE = re.compile(r"File format\s*:\s*(\S+)")
+_SINFO_GRID_RE = re.compile(r"(\d+)\s*:\s*(\w+)\s*:.*?points=(\d+)\s*\((\d+)x(\d+)\)")
+_SINFO_COORD_RE = re.compile(
+    r"(?P<axis>longitude|latitude)\s*:\s*"
+    r"(?P<start>-?[\d.]+)\s+to\s+(?P<end>-?[\d.]+)\s+by\s+(?P<inc>-?[\d.]+)\s+"
+    r"\[(?P<units>[^\]]+)\]"
+)
+_SINFO_VERT_RE = re.compile(r"(\d+)\s*:\s*(\w+)\s*:.*?levels=(\d+)")
+_STEPS_RE = re.compile(r"time\s*:\s*(\d+)\s+steps?")
+_REFTIME_RE = re.compile(r"RefTime\s*=\s*([^\s]+\s+[^\s]+)")
+_UNITS_RE = re.compile(r"Units\s*=\s*(\w+)")
+_CALENDAR_RE = re.compile(r"Calendar\s*=\s*(\w+)")
+_DATETIME_RE = re.compile(r"\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}")
+
+# vlist header and variable table
+_VLIST_ID_RE = re.compile(r"vlistID\s+(\d+)")
+_VLIST_FIELD_RES = {
+    field_name: re.compile(rf"{field_name}\s*:\s*(-?\d+)")
+    for field_name in (
+        "nvars",
+        "ngrids",
+        "nzaxis",
+        "nsubtypes",
+        "taxisID",
+        "instID",
+        "modelID",
+        "tableID",
+    )
+}
+_VLIST_VAR_SECTION_RE = re.compile(
+    r"varID param.*?(?=varID\s+levID|varID\s+size|$)", re.DOTALL
+)
+
+# partab table name and Fortran namelist fields
+_TABLE_NAME_RE = re.compile(r"Parameter table:\s*(.+)")
+_NAMELIST_SPLIT_RE = re.compile(r"&parameter", re.IGNORECASE)
+_NAMELIST_CODE_RE = re.compile(r'code\s*=\s*["\']?([^"\',\n]+)["\']?', re.IGNORECASE)
+_NAMELIST_NAME_RE = re.compile(
+    r'name\s*=\s*["\']?([^"\',\n]+?)["\']?(?:\s|$)', re.IGNORECASE
+)
+_NAMELIST_UNITS_RE = re.compile(r'units\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE)
+_NAMELIST_LONGNAME_RE = re.compile(
+    r'long_name\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE
+)
+
 
 class SinfoParser(CDOParser[SinfoResult]):
     """
@@ -45,11 +110,20 @@ class SinfoParser(CDOParser[SinfoResult]):
             CDOParseError: If parsing fails.
         """
         try:
-            file_format = self._parse_file_format(output)
-            variables = self._parse_variables(output)
-            grid_coords = self._parse_grid_coordinates(output)
-            vertical_coords = self._parse_vertical_coordinates(output)
-            time_info = self._parse_time_coordinates(output)
+            sections = self._split_sections(output)
+            if "time" not in sections:
+                raise CDOParseError(
+                    message="Time coordinate section not found",
+                    raw_output=output[:500],
+                )
+
+            file_format = self._parse_file_format(sections.get("header", ""))
+            variables = self._parse_variables(sections.get("variables", ""))
+            grid_coords = self._parse_grid_coordinates(sections.get("grid", ""))
+            vertical_coords = self._parse_vertical_coordinates(
+                sections.get("vertical", "")
+            )
+            time_info = self._parse_time_coordinates(sections["time"])
 
             return SinfoResult(
                 file_format=file_format,
@@ -64,91 +138,72 @@ class SinfoParser(CDOParser[SinfoResult]):
                 raw_output=output[:500],
             ) from e
 
-    def _parse_file_format(self, output: str) -> str:
+    def _split_sections(self, output: str) -> dict[str, str]:
+        """
+        Split sinfo output into its sections in a single pass over the lines.
+
+        Returns a mapping from section name ("header", "variables", "grid",
+        "vertical", "time") to that section's text. Section header lines
+        other than the variable table header are dropped, as is the trailing
+        "cdo sinfo: ..." log line and anything after it.
+        """
+        sections: dict[str, list[str]] = {"header": []}
+        current: list[str] | None = sections["header"]
+
+        for line in output.splitlines():
+            stripped = line.lstrip()
+            for prefix, name in _SINFO_SECTIONS:
+                if stripped.startswith(prefix):
+                    current = sections.setdefault(name, [])
+                    if name != "variables":
+                        line = stripped[len(prefix) :].lstrip().removeprefix(":")
+                    break
+            else:
+                if _SINFO_TRAILER_RE.match(stripped):
+                    current = None
+            if current is not None:
+                current.append(line)
+
+        return {name: "\n".join(lines) for name, lines in sections.items()}
+
+    def _parse_file_format(self, content: str) -> str:
         """Extract file format."""
-        match = re.search(r"File format\s*:\s*(\S+)", output)
+        match = _FILE_FORMAT_RE.search(content)
         if match:
-            return match.group(1)
+            return _intern(match.group(1))
         return "Unknown"
 
-    def _parse_variables(self, output: str) -> list[DatasetVariable]:
+    def _parse_variables(self, content: str) -> list[DatasetVariable]:
         """Parse variable table."""
-        variables: list[DatasetVariable] = []
-
-        print(output)
-        # Find variable section (between header and "Grid coordinates")
-        var_section = re.search(
-            r"-1 : Institut Source.*?(?=Grid coordinates|$)", output, re.DOTALL
-        )
-
-        if not var_section:
-            return variables
-
-        lines = var_section.group(0).split("\n")[1:]  # Skip header
-
-        for line in lines:
-            line = line.strip()
-            if not line or ":" not in line:
-                continue
-
-            # Parse: var_id : institut source table_code steptype levels num points num2 dtype : param_id
-            parts = line.split(":")
-            if len(parts) < 3:
-                continue
-
-            try:
-                var_id = int(parts[0].strip())
-                fields = parts[1].strip().split()
-
-                # Parse param_id from third part (sinfo output does NOT include variable names)
-                # Format: "param_id" only (e.g., "167")
-                param_id_str = parts[2].strip()
-                param_id = int(param_id_str) if param_id_str else -1
-
-                if len(fields) >= 9:
-                    variables.append(
-                        DatasetVariable(
-                            var_id=var_id,
-                            institut=fields[0],
-                            source=fields[1],
-                            table_code=fields[2],
-                            steptype=fields[3],
-                            levels=int(fields[4]),
-                            num=int(fields[5]),
-                            points=int(fields[6]),
-                            num2=int(fields[7]),
-                            dtype=fields[8],
-                            param_id=param_id,
-                            name=None,  # sinfo doesn't provide variable names
-                        )
-                    )
-            except (ValueError, IndexError):
-                continue
-
-        return variables
+        # sinfo output does NOT include variable names, only the param_id
+        return [
+            DatasetVariable(
+                var_id=int(m[1]),
+                institut=_intern(m[2]),
+                source=_intern(m[3]),
+                table_code=_intern(m[4]),
+                steptype=_intern(m[5]),
+                levels=int(m[6]),
+                num=int(m[7]),
+                points=int(m[8]),
+                num2=int(m[9]),
+                dtype=_intern(m[10]),
+                param_id=int(m[11]) if m[11] else -1,
+                name=None,  # sinfo doesn't provide variable names
+            )
+            for m in _SINFO_VAR_RE.finditer(content)
+        ]
 
-    def _parse_grid_coordinates(self, output: str) -> list[GridCoordinates]:
+    def _parse_grid_coordinates(self, content: str) -> list[GridCoordinates]:
         """Parse grid coordinates section."""
         grids: list[GridCoordinates] = []
 
-        # Find Grid coordinates section
-        grid_section = re.search(
-            r"Grid coordinates\s*:(.+?)(?=Vertical coordinates|Time coordinate|$)",
-            output,
-            re.DOTALL,
-        )
-
-        if not grid_section:
-            return grids
-
-        content = grid_section.group(1)
-
-        # Parse each grid entry
-        for grid_match in re.finditer(
-            r"(\d+)\s*:\s*(\w+)\s*:.*?points=(\d+)\s*\((\d+)x(\d+)\)", content
-        ):
+        # Parse each grid entry; its coordinate lines run up to the next entry
+        grid_matches = list(_SINFO_GRID_RE.finditer(content))
+        bounds = [m.start() for m in grid_matches[1:]] + [len(content)]
+        for grid_match, end in zip(grid_matches, bounds):
             grid_id = int(grid_match.group(1))
-            gridtype = grid_match.group(2)
+            gridtype = _intern(grid_match.group(2))
             points = int(grid_match.group(3))
             xsize = int(grid_match.group(4))
             ysize = int(grid_match.group(5))
@@ -161,50 +216,31 @@ class SinfoParser(CDOParser[SinfoResult]):
                 ysize=ysize,
             )
 
-            # Parse longitude info
-            lon_match = re.search(
-                r"longitude\s*:\s*([\d.]+)\s+to\s+([\d.]+)\s+by\s+([\d.]+)\s+\[([^\]]+)\]",
-                content[grid_match.end() :],
-            )
-            if lon_match:
-                grid.longitude_start = float(lon_match.group(1))
-                grid.longitude_end = float(lon_match.group(2))
-                grid.longitude_inc = float(lon_match.group(3))
-                grid.longitude_units = lon_match.group(4)
-
-            # Parse latitude info
-            lat_match = re.search(
-                r"latitude\s*:\s*([\d.]+)\s+to\s+([\d.]+)\s+by\s+([\d.]+)\s+\[([^\]]+)\]",
-                content[grid_match.end() :],
-            )
-            if lat_match:
-                grid.latitude_start = float(lat_match.group(1))
-                grid.latitude_end = float(lat_match.group(2))
-                grid.latitude_inc = float(lat_match.group(3))
-                grid.latitude_units = lat_match.group(4)
+            # Parse longitude and latitude info
+            for coord in _SINFO_COORD_RE.finditer(content, grid_match.end(), end):
+                if coord["axis"] == "longitude":
+                    grid.longitude_start = float(coord["start"])
+                    grid.longitude_end = float(coord["end"])
+                    grid.longitude_inc = float(coord["inc"])
+                    grid.longitude_units = _intern(coord["units"])
+                else:
+                    grid.latitude_start = float(coord["start"])
+                    grid.latitude_end = float(coord["end"])
+                    grid.latitude_inc = float(coord["inc"])
+                    grid.latitude_units = _intern(coord["units"])
 
             grids.append(grid)
 
         return grids
 
-    def _parse_vertical_coordinates(self, output: str) -> list[VerticalCoordinates]:
+    def _parse_vertical_coordinates(self, content: str) -> list[VerticalCoordinates]:
         """Parse vertical coordinates section."""
         verticals: list[VerticalCoordinates] = []
 
-        # Find Vertical coordinates section
-        vert_section = re.search(
-            r"Vertical coordinates\s*:(.+?)(?=Time coordinate|$)", output, re.DOTALL
-        )
-
-        if not vert_section:
-            return verticals
-
-        content = vert_section.group(1)
-
         # Parse each vertical coordinate entry
-        for vert_match in re.finditer(r"(\d+)\s*:\s*(\w+)\s*:.*?levels=(\d+)", content):
+        for vert_match in _SINFO_VERT_RE.finditer(content):
             zaxis_id = int(vert_match.group(1))
-            zaxistype = vert_match.group(2)
+            zaxistype = _intern(vert_match.group(2))
             levels = int(vert_match.group(3))
 
             verticals.append(
@@ -217,42 +253,28 @@ class SinfoParser(CDOParser[SinfoResult]):
 
         return verticals
 
-    def _parse_time_coordinates(self, output: str) -> TimeInfo:
+    def _parse_time_coordinates(self, content: str) -> TimeInfo:
         """Parse time coordinate section."""
-        # Find Time coordinate section
-        time_section = re.search(
-            r"Time coordinate\s*:(.+?)(?=cdo\s+sinfo:|$)", output, re.DOTALL
-        )
-
-        if not time_section:
-            raise CDOParseError(
-                message="Time coordinate section not found",
-                raw_output=output[:500],
-            )
-
-        content = time_section.group(1)
-
         # Parse number of steps
-        steps_match = re.search(r"time\s*:\s*(\d+)\s+steps?", content)
+        steps_match = _STEPS_RE.search(content)
         ntime = int(steps_match.group(1)) if steps_match else 0
 
         # Parse RefTime, Units, Calendar
-        ref_match = re.search(r"RefTime\s*=\s*([^\s]+\s+[^\s]+)", content)
-        units_match = re.search(r"Units\s*=\s*(\w+)", content)
-        cal_match = re.search(r"Calendar\s*=\s*(\w+)", content)
+        ref_match = _REFTIME_RE.search(content)
+        units_match = _UNITS_RE.search(content)
+        cal_match = _CALENDAR_RE.search(content)
 
         ref_time = ref_match.group(1) if ref_match else ""
-        units = units_match.group(1) if units_match else ""
-        calendar = cal_match.group(1) if cal_match else "standard"
+        units = _intern(units_match.group(1)) if units_match else ""
+        calendar = _intern(cal_match.group(1)) if cal_match else "standard"
 
         # Parse first and last timesteps (exclude RefTime line)
         lines_without_reftime = [
-            line for line in content.split("\n") if "RefTime" not in line
+            line for line in content.splitlines() if "RefTime" not in line
         ]
         timesteps = []
         for line in lines_without_reftime:
-            matches = re.findall(r"(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})", line)
-            timesteps.extend(matches)
+            timesteps.extend(_DATETIME_RE.findall(line))
 
         first_timestep = timesteps[0] if timesteps else None
         last_timestep = timesteps[-1] if timesteps else None
@@ -290,7 +312,7 @@ class InfoParser(CDOParser[InfoResult]):
         timesteps: list[TimestepInfo] = []
 
         # Parse each timestep line
-        for line in output.split("\n"):
+        for line in output.splitlines():
             line = line.strip()
             if not line or ":" not in line:
                 continue
@@ -322,7 +344,7 @@ class InfoParser(CDOParser[InfoResult]):
                 if len(datetime_parts) < 5:  # Need date, time, level, gridsize, miss
                     continue
                 date = datetime_parts[0]
-                time = datetime_parts[1]
+                time = _intern(datetime_parts[1])
                 level = int(datetime_parts[2])
                 gridsize = int(datetime_parts[3])
                 miss = int(datetime_parts[4])
@@ -386,7 +408,7 @@ class VlistParser(CDOParser[VlistResult]):
         """
         try:
             # Parse header
-            vlist_id_match = re.search(r"vlistID\s+(\d+)", output)
+            vlist_id_match = _VLIST_ID_RE.search(output)
             vlist_id = int(vlist_id_match.group(1)) if vlist_id_match else 0
 
             nvars = self._extract_field(output, "nvars")
@@ -428,7 +450,7 @@ class VlistParser(CDOParser[VlistResult]):
 
     def _extract_field(self, output: str, field_name: str) -> int:
         """Extract integer field value."""
-        match = re.search(rf"{field_name}\s*:\s*(-?\d+)", output)
+        match = _VLIST_FIELD_RES[field_name].search(output)
         return int(match.group(1)) if match else 0
 
     def _parse_variables(self, output: str) -> list[VariableInfo]:
@@ -436,14 +458,12 @@ class VlistParser(CDOParser[VlistResult]):
         variables: list[VariableInfo] = []
 
         # Find variable definition section
-        var_section = re.search(
-            r"varID param.*?(?=varID\s+levID|varID\s+size|$)", output, re.DOTALL
-        )
+        var_section = _VLIST_VAR_SECTION_RE.search(output)
 
         if not var_section:
             return variables
 
-        lines = var_section.group(0).split("\n")[1:]  # Skip header
+        lines = var_section.group(0).splitlines()[1:]  # Skip header
 
         for line in lines:
             line = line.strip()
@@ -521,7 +541,7 @@ class PartabParser(CDOParser[PartabResult]):
         table_name = None
 
         # Extract table name if present
-        table_match = re.search(r"Parameter table:\s*(.+)", output)
+        table_match = _TABLE_NAME_RE.search(output)
         if table_match:
             table_name = table_match.group(1).strip()
 
@@ -530,7 +550,7 @@ class PartabParser(CDOParser[PartabResult]):
             parameters = self._parse_fortran_namelist(output)
         else:
             # Parse table format
-            lines = output.strip().split("\n")
+            lines = output.splitlines()
 
             for line in lines:
                 line = line.strip()
@@ -583,27 +603,19 @@ class PartabParser(CDOParser[PartabResult]):
         parameters: list[PartabInfo] = []
 
         # Split by namelist blocks (between & and /)
-        blocks = re.split(r"&parameter", output, flags=re.IGNORECASE)
+        blocks = _NAMELIST_SPLIT_RE.split(output)
 
         for block in blocks[1:]:  # Skip first empty block before first &parameter
             # Find end of this namelist (/)
-            end_match = re.search(r"/", block)
-            if end_match:
-                block = block[: end_match.start()]
+            end = block.find("/")
+            if end != -1:
+                block = block[:end]
 
             # Extract fields using regex
-            code_match = re.search(
-                r'code\s*=\s*["\']?([^"\',\n]+)["\']?', block, re.IGNORECASE
-            )
-            name_match = re.search(
-                r'name\s*=\s*["\']?([^"\',\n]+?)["\']?(?:\s|$)', block, re.IGNORECASE
-            )
-            units_match = re.search(
-                r'units\s*=\s*["\']([^"\']+)["\']', block, re.IGNORECASE
-            )
-            longname_match = re.search(
-                r'long_name\s*=\s*["\']([^"\']+)["\']', block, re.IGNORECASE
-            )
+            code_match = _NAMELIST_CODE_RE.search(block)
+            name_match = _NAMELIST_NAME_RE.search(block)
+            units_match = _NAMELIST_UNITS_RE.search(block)
+            longname_match = _NAMELIST_LONGNAME_RE.search(block)
 
             if name_match:
                 name = name_match.group(1).strip()
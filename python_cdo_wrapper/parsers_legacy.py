@@ -8,8 +8,140 @@ CDO commands into structured Python dictionaries for easier programmatic access.
 from __future__ import annotations
 
 import re
+import threading
 from abc import ABC, abstractmethod
-from typing import Any
+from collections import OrderedDict
+from functools import lru_cache
+from hashlib import blake2b
+from itertools import chain
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from .utils import _intern
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Callable, Iterable, Iterator
+
+# Matches the "N :" index prefix of sinfo variable, grid and zaxis rows
+_VAR_LINE_RE = re.compile(r"^\s*(\d+)\s*:")
+
+# sinfo grid/zaxis row attributes, e.g. "points=17415 (135x129)", "levels=1"
+_POINTS_RE = re.compile(r"points=(\d+)")
+_DIMS_RE = re.compile(r"\((\d+)x(\d+)\)")
+_LEVELS_RE = re.compile(r"levels=(\d+)")
+
+# sinfo coordinate detail, e.g. "lon : 66.5 to 100 by 0.25 [degrees_east]"
+_COORD_RE = re.compile(
+    r"^\s*(?P<axis>lon|lat)\s*:\s*"
+    r"(?P<start>[-\d.]+)\s+to\s+(?P<end>[-\d.]+)\s+by\s+(?P<res>[-\d.]+)\s*"
+    r"\[(?P<units>[^\]]+)\]"
+)
+
+# sinfo time section
+_STEPS_RE = re.compile(r"^\s*time\s*:\s*(\d+)\s+steps")
+_REFTIME_RE = re.compile(r"RefTime\s*=\s*([\d-]+ [\d:]+)")
+_UNITS_RE = re.compile(r"Units\s*=\s*(\w+)")
+_CALENDAR_RE = re.compile(r"Calendar\s*=\s*(\w+)")
+_DATETIME_RE = re.compile(r"\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}")
+_DOTS_RE = re.compile(r"^\.+$")
+
+# griddes keys whose values are whitespace-separated coordinate arrays
+_GRID_ARRAY_KEYS = frozenset({"xvals", "yvals", "xbounds", "ybounds"})
+
+
+def _parse_float_array(values_str: str) -> list[float]:
+    """Parse whitespace-separated floats, skipping malformed tokens."""
+    tokens = values_str.split()
+    try:
+        return list(map(float, tokens))
+    except ValueError:
+        pass
+
+    # Rare path: convert token by token and drop the ones that are not numbers
+    values = []
+    for val in tokens:
+        try:
+            values.append(float(val))
+        except ValueError:
+            continue
+    return values
+
+
+def _stride_check(seconds: np.ndarray) -> tuple[bool, int]:
+    """Return whether epoch seconds are evenly spaced, and the common spacing."""
+    deltas = np.diff(seconds)
+    if deltas.size and bool((deltas == deltas[0]).all()):
+        return True, int(deltas[0])
+    return False, 0
+
+
+def _interval_label(delta_seconds: float) -> str:
+    """Convert a regular timestep spacing to a human-readable label."""
+    if delta_seconds == 3600:
+        return "1 hour"
+    if delta_seconds == 86400:
+        return "1 day"
+    if delta_seconds % 86400 == 0:
+        return f"{int(delta_seconds / 86400)} days"
+    if delta_seconds % 3600 == 0:
+        return f"{int(delta_seconds / 3600)} hours"
+    return f"{delta_seconds} seconds"
+
+
+def _strip_quotes(value: str) -> str:
+    """Remove one pair of matching single or double quotes around a value."""
+    if len(value) >= 2 and value[0] in "\"'" and value[-1] == value[0]:
+        return value[1:-1]
+    return value
+
+
+def _coerce(value: str) -> int | float | str:
+    """Convert a scalar attribute value to int or float, else keep the string."""
+    # Only values that can start a number (incl. "nan"/"inf") are worth trying
+    if not value or not (value[0].isdigit() or value[0] in "+-.nNiI"):
+        return value
+    try:
+        return int(value)
+    except ValueError:
+        try:
+            return float(value)
+        except ValueError:
+            return value
+
+
+def _int_or_str(value: str) -> int | str:
+    """Convert an integer field to int, else keep it as an interned string."""
+    # isdecimal() accepts exactly the digits int() does, so no try/except needed;
+    # unsigned counts are by far the common case, so test those first
+    if value.isdecimal():
+        return int(value)
+    digits = value[1:] if value[:1] in "+-" else value
+    return int(value) if digits.isdecimal() else _intern(value)
+
+
+# sinfo variable table columns and their coercions, in display order
+_SINFO_COLUMNS: tuple[tuple[str, Callable[[str], int | str]], ...] = (
+    ("institut", _intern),
+    ("source", _intern),
+    ("table", str),
+    ("steptype", _intern),
+    ("levels", _int_or_str),
+    ("num", _int_or_str),
+    ("points", _int_or_str),
+    ("num2", _int_or_str),
+    ("dtype", _intern),
+)
+_SINFO_COLUMNS_OLD: tuple[tuple[str, Callable[[str], int | str]], ...] = (
+    ("date", str),
+    ("time", str),
+    ("level", _int_or_str),
+    ("gridsize", _int_or_str),
+    ("num", _int_or_str),
+    ("dtype", _intern),
+)
 
 
 class CDOParser(ABC):
@@ -28,6 +160,23 @@ class CDOParser(ABC):
         """
         pass
 
+    def parse_lines(
+        self, lines: Iterable[str]
+    ) -> dict[str, Any] | list[dict[str, Any]]:
+        """
+        Parse CDO text output supplied line by line.
+
+        Built-in parsers consume the iterable lazily, so lines can be fed
+        straight from a pipe without first materializing the whole output.
+
+        Args:
+            lines: Lines of raw text output from a CDO command.
+
+        Returns:
+            Parsed structured data as dict or list of dicts.
+        """
+        return self.parse("\n".join(lines))
+
 
 class GriddesParser(CDOParser):
     """Parser for griddes output."""
@@ -42,58 +191,40 @@ class GriddesParser(CDOParser):
         Returns:
             Dictionary containing grid information.
         """
+        return self.parse_lines(output.splitlines())
+
+    def parse_lines(self, lines: Iterable[str]) -> dict[str, Any]:
+        """Parse griddes output supplied line by line (see ``parse``)."""
         grid_info: dict[str, Any] = {}
-        lines = output.strip().split("\n")
 
         for line in lines:
-            line = line.strip()
-            if not line or line.startswith("#"):
+            s = line.strip()
+            if not s or s.startswith("#"):
                 continue
 
-            # Handle key = value pairs
-            if "=" in line:
-                key, value = line.split("=", 1)
-                key = key.strip()
-                value = value.strip()
-
-                # Try to convert to appropriate type
-                if value.isdigit():
-                    grid_info[key] = int(value)
-                elif self._is_float(value):
-                    grid_info[key] = float(value)
-                else:
-                    grid_info[key] = value
+            key, eq, value = s.partition("=")
+            if not eq:
+                continue
+            key = key.rstrip()
+            value = value.lstrip()
+
+            # Multi-value lines (xvals, yvals, ...) hold coordinate arrays
+            if key in _GRID_ARRAY_KEYS:
+                grid_info[key] = self._parse_array(value)
+                continue
 
-            # Handle multi-value lines (like xvals, yvals)
-            elif line.startswith(("xvals", "yvals", "xbounds", "ybounds")):
-                parts = line.split("=", 1)
-                if len(parts) == 2:
-                    key = parts[0].strip()
-                    values_str = parts[1].strip()
-                    # Parse array values
-                    grid_info[key] = self._parse_array(values_str)
+            # Quoted values are string literals; anything else may be numeric
+            if value[:1] in ("'", '"'):
+                grid_info[key] = _strip_quotes(value)
+            else:
+                grid_info[key] = _coerce(value)
 
         return grid_info
 
-    @staticmethod
-    def _is_float(value: str) -> bool:
-        """Check if a string represents a float."""
-        try:
-            float(value)
-            return True
-        except ValueError:
-            return False
-
     @staticmethod
     def _parse_array(values_str: str) -> list[float]:
         """Parse array values from string."""
-        values = []
-        for val in values_str.split():
-            try:
-                values.append(float(val))
-            except ValueError:
-                continue
-        return values
+        return _parse_float_array(values_str)
 
 
 class ZaxisdesParser(CDOParser):
@@ -109,50 +240,35 @@ class ZaxisdesParser(CDOParser):
         Returns:
             Dictionary containing z-axis information.
         """
+        return self.parse_lines(output.splitlines())
+
+    def parse_lines(self, lines: Iterable[str]) -> dict[str, Any]:
+        """Parse zaxisdes output supplied line by line (see ``parse``)."""
         zaxis_info: dict[str, Any] = {}
-        lines = output.strip().split("\n")
 
         for line in lines:
             line = line.strip()
             if not line or line.startswith("#"):
                 continue
 
-            if "=" in line:
-                key, value = line.split("=", 1)
-                key = key.strip()
-                value = value.strip()
-
-                # Handle arrays (levels, vct)
-                if key in ("levels", "vct", "lbounds", "ubounds"):
-                    zaxis_info[key] = self._parse_array(value)
-                elif value.isdigit():
-                    zaxis_info[key] = int(value)
-                elif self._is_float(value):
-                    zaxis_info[key] = float(value)
-                else:
-                    zaxis_info[key] = value
+            key, eq, value = line.partition("=")
+            if not eq:
+                continue
+            key = key.rstrip()
+            value = value.lstrip()
 
-        return zaxis_info
+            # Handle arrays (levels, vct)
+            if key in ("levels", "vct", "lbounds", "ubounds"):
+                zaxis_info[key] = self._parse_array(value)
+            else:
+                zaxis_info[key] = _coerce(value)
 
-    @staticmethod
-    def _is_float(value: str) -> bool:
-        """Check if a string represents a float."""
-        try:
-            float(value)
-            return True
-        except ValueError:
-            return False
+        return zaxis_info
 
     @staticmethod
     def _parse_array(values_str: str) -> list[float]:
         """Parse array values from string."""
-        values = []
-        for val in values_str.split():
-            try:
-                values.append(float(val))
-            except ValueError:
-                continue
-        return values
+        return _parse_float_array(values_str)
 
 
 class SinfoParser(CDOParser):
@@ -173,6 +289,10 @@ class SinfoParser(CDOParser):
             - vertical: Vertical coordinate information
             - time: Time coordinate information with resolution and timesteps
         """
+        return self.parse_lines(output.splitlines())
+
+    def parse_lines(self, lines: Iterable[str]) -> dict[str, Any]:
+        """Parse sinfo output supplied line by line (see ``parse``)."""
         info: dict[str, Any] = {
             "variables": [],
             "metadata": {},
@@ -180,22 +300,19 @@ class SinfoParser(CDOParser):
             "vertical": {},
             "time": {},
         }
-        lines = output.strip().split("\n")
 
         current_section = None
         grid_id = None
         vertical_id = None
         time_buffer: list[str] = []
 
-        i = 0
-        while i < len(lines):
-            line = lines[i]
+        rows: Iterator[str] = iter(lines)
+        while (line := next(rows, None)) is not None:
             line_stripped = line.strip()
 
             # Detect file format
             if "File format" in line:
                 info["metadata"]["format"] = line.split(":")[-1].strip()
-                i += 1
                 continue
 
             # Detect variable table header with metadata fields
@@ -208,37 +325,58 @@ class SinfoParser(CDOParser):
                     fields = header_parts[1].strip()
                     if fields:
                         info["metadata"]["variable_fields"] = fields
-                i += 1
+
+                # The header names the column layout, so pick it once here
+                columns = (
+                    _SINFO_COLUMNS
+                    if "Institut" in line_stripped
+                    else _SINFO_COLUMNS_OLD
+                )
+
+                # The table is a contiguous block of "N : ..." rows; consume it
+                # in a tight loop that skips the section checks below. Bound
+                # methods are hoisted into locals to avoid per-row lookups.
+                is_row = _VAR_LINE_RE.match
+                parse_row = SinfoParser._parse_variable_line
+                append = info["variables"].append
+                for line in rows:
+                    if not is_row(line):
+                        break
+                    var_info = parse_row(line.strip(), columns)
+                    if var_info:
+                        append(var_info)
+                else:
+                    break  # Output ended inside the variable table
+
+                # Dispatch the line that ended the table like any other line
+                rows = chain((line,), rows)
                 continue
 
             # Detect grid section
             if "Grid coordinates" in line:
                 current_section = "grid"
                 # Extract grid ID if present
-                match = re.search(r"^\s*(\d+)\s*:", line)
+                match = _VAR_LINE_RE.match(line)
                 if match:
                     grid_id = int(match.group(1))
-                i += 1
                 continue
 
             # Detect vertical coordinates section
             if "Vertical coordinates" in line:
                 current_section = "vertical"
                 # Extract vertical ID if present
-                match = re.search(r"^\s*(\d+)\s*:", line)
+                match = _VAR_LINE_RE.match(line)
                 if match:
                     vertical_id = int(match.group(1))
-                i += 1
                 continue
 
             # Detect time coordinate section
             if "Time coordinate" in line:
                 current_section = "time"
-                i += 1
                 continue
 
             # Parse sections based on current context
-            if current_section == "variables" and re.match(r"^\s*\d+\s*:", line):
+            if current_section == "variables" and _VAR_LINE_RE.match(line):
                 var_info = SinfoParser._parse_variable_line(line_stripped)
                 if var_info:
                     info["variables"].append(var_info)
@@ -252,8 +390,6 @@ class SinfoParser(CDOParser):
                 # Time section can span multiple lines
                 SinfoParser._parse_time_line(line_stripped, info["time"], time_buffer)
 
-            i += 1
-
         # Finalize time parsing (process buffered timesteps)
         if time_buffer:
             SinfoParser._finalize_time_parsing(info["time"], time_buffer)
@@ -261,74 +397,45 @@ class SinfoParser(CDOParser):
         return info
 
     @staticmethod
-    def _parse_variable_line(line: str) -> dict[str, Any] | None:
+    def _parse_variable_line(
+        line: str,
+        columns: tuple[tuple[str, Callable[[str], int | str]], ...] | None = None,
+    ) -> dict[str, Any] | None:
         """Parse a single variable line from sinfo output.
 
         Example input: "1 : unknown  unknown  v instant       1   1     17415   1  F32  : 260"
         Format: "Index : Institut Source T Steptype Levels Num Points Num Dtype : Parameter"
-        """
-        # Find the last colon which separates the parameter name
-        last_colon_idx = line.rfind(":")
-        if last_colon_idx == -1:
-            return None
 
-        var_name = line[last_colon_idx + 1 :].strip()
-        if not var_name or var_name in ("Parameter name", "Parameter ID", ""):
+        ``columns`` is the layout detected from the table header; rows that do
+        not fit it (or calls without it) fall back to guessing by field count.
+        """
+        # The first colon separates the index, the last one the parameter name
+        _, first_colon, rest = line.partition(":")
+        middle_section, last_colon, var_name = rest.rpartition(":")
+        if not first_colon or not last_colon:
             return None
 
-        # Find the first colon which separates the index
-        first_colon_idx = line.find(":")
-        if first_colon_idx == -1 or first_colon_idx == last_colon_idx:
+        var_name = var_name.strip()
+        if not var_name or var_name in ("Parameter name", "Parameter ID"):
             return None
 
-        # Extract the middle section between first and last colons
-        middle_section = line[first_colon_idx + 1 : last_colon_idx].strip()
         fields = middle_section.split()
 
         result: dict[str, Any] = {"name": var_name}
 
         # Parse based on field count - format can vary
         # Typical format: Institut Source T Steptype Levels Num Points Num Dtype
-        if len(fields) >= 9:
-            result["institut"] = fields[0]
-            result["source"] = fields[1]
-            result["table"] = fields[2]
-            result["steptype"] = fields[3]
-            try:
-                result["levels"] = int(fields[4])
-            except ValueError:
-                result["levels"] = fields[4]
-            try:
-                result["num"] = int(fields[5])
-            except ValueError:
-                result["num"] = fields[5]
-            try:
-                result["points"] = int(fields[6])
-            except ValueError:
-                result["points"] = fields[6]
-            try:
-                result["num2"] = int(fields[7])
-            except ValueError:
-                result["num2"] = fields[7]
-            result["dtype"] = fields[8]
         # Older format: Date Time Level Gridsize Num Dtype
-        elif len(fields) >= 6:
-            result["date"] = fields[0]
-            result["time"] = fields[1]
-            try:
-                result["level"] = int(fields[2])
-            except ValueError:
-                result["level"] = fields[2]
-            try:
-                result["gridsize"] = int(fields[3])
-            except ValueError:
-                result["gridsize"] = fields[3]
-            try:
-                result["num"] = int(fields[4])
-            except ValueError:
-                result["num"] = fields[4]
-            result["dtype"] = fields[5]
-
+        if columns is None or len(fields) < len(columns):
+            if len(fields) >= 9:
+                columns = _SINFO_COLUMNS
+            elif len(fields) >= 6:
+                columns = _SINFO_COLUMNS_OLD
+            else:
+                return result
+
+        for (key, convert), field in zip(columns, fields):
+            result[key] = convert(field)
         return result
 
     @staticmethod
@@ -341,7 +448,7 @@ class SinfoParser(CDOParser):
             return
 
         # Parse grid ID and type (e.g., "1 : lonlat : points=17415 (135x129)")
-        if ":" in line_stripped and re.match(r"^\s*\d+\s*:", line_stripped):
+        if ":" in line_stripped and _VAR_LINE_RE.match(line_stripped):
             parts = line_stripped.split(":")
             if len(parts) >= 2:
                 grid_id = int(parts[0].strip())
@@ -353,33 +460,25 @@ class SinfoParser(CDOParser):
                 if len(parts) >= 3:
                     points_info = parts[2].strip()
                     # Extract points count (e.g., "points=17415 (135x129)")
-                    points_match = re.search(r"points=(\d+)", points_info)
+                    points_match = _POINTS_RE.search(points_info)
                     if points_match:
                         grid_info["points"] = int(points_match.group(1))
 
                     # Extract dimensions (e.g., "135x129")
-                    dims_match = re.search(r"\((\d+)x(\d+)\)", points_info)
+                    dims_match = _DIMS_RE.search(points_info)
                     if dims_match:
                         grid_info["xsize"] = int(dims_match.group(1))
                         grid_info["ysize"] = int(dims_match.group(2))
             return
 
         # Parse coordinate details (lon/lat lines)
-        coord_match = re.match(
-            r"^\s*(lon|lat)\s*:\s*([-\d.]+)\s+to\s+([-\d.]+)\s+by\s+([-\d.]+)\s*\[([^\]]+)\]",
-            line_stripped,
-        )
+        coord_match = _COORD_RE.match(line_stripped)
         if coord_match:
-            coord_name = coord_match.group(1)
-            start = float(coord_match.group(2))
-            end = float(coord_match.group(3))
-            step = float(coord_match.group(4))
-            units = coord_match.group(5)
-
-            grid_info[f"{coord_name}_start"] = start
-            grid_info[f"{coord_name}_end"] = end
-            grid_info[f"{coord_name}_resolution"] = step
-            grid_info[f"{coord_name}_units"] = units
+            axis = coord_match["axis"]
+            grid_info[f"{axis}_start"] = float(coord_match["start"])
+            grid_info[f"{axis}_end"] = float(coord_match["end"])
+            grid_info[f"{axis}_resolution"] = float(coord_match["res"])
+            grid_info[f"{axis}_units"] = coord_match["units"]
 
     @staticmethod
     def _parse_vertical_line(
@@ -393,7 +492,7 @@ class SinfoParser(CDOParser):
             return
 
         # Parse vertical axis (e.g., "1 : surface : levels=1")
-        if ":" in line_stripped and re.match(r"^\s*\d+\s*:", line_stripped):
+        if ":" in line_stripped and _VAR_LINE_RE.match(line_stripped):
             parts = line_stripped.split(":")
             if len(parts) >= 2:
                 vertical_id = int(parts[0].strip())
@@ -404,7 +503,7 @@ class SinfoParser(CDOParser):
                 # Parse levels count if present
                 if len(parts) >= 3:
                     levels_info = parts[2].strip()
-                    levels_match = re.search(r"levels=(\d+)", levels_info)
+                    levels_match = _LEVELS_RE.search(levels_info)
                     if levels_match:
                         vertical_info["levels"] = int(levels_match.group(1))
 
@@ -420,7 +519,7 @@ class SinfoParser(CDOParser):
             return
 
         # Parse timestep count (e.g., "time : 43464 steps")
-        steps_match = re.match(r"^\s*time\s*:\s*(\d+)\s+steps", line_stripped)
+        steps_match = _STEPS_RE.match(line_stripped)
         if steps_match:
             time_info["steps"] = int(steps_match.group(1))
             return
@@ -428,30 +527,30 @@ class SinfoParser(CDOParser):
         # Parse RefTime, Units, Calendar (e.g., "RefTime = 1901-01-01 00:00:00  Units = hours  Calendar = standard")
         if "RefTime" in line_stripped:
             # Extract RefTime
-            reftime_match = re.search(r"RefTime\s*=\s*([\d-]+ [\d:]+)", line_stripped)
+            reftime_match = _REFTIME_RE.search(line_stripped)
             if reftime_match:
                 time_info["reftime"] = reftime_match.group(1)
 
             # Extract Units
-            units_match = re.search(r"Units\s*=\s*(\w+)", line_stripped)
+            units_match = _UNITS_RE.search(line_stripped)
             if units_match:
                 time_info["units"] = units_match.group(1)
 
             # Extract Calendar
-            calendar_match = re.search(r"Calendar\s*=\s*(\w+)", line_stripped)
+            calendar_match = _CALENDAR_RE.search(line_stripped)
             if calendar_match:
                 time_info["calendar"] = calendar_match.group(1)
             return
 
         # Check if line contains timesteps (date-time values)
         # Pattern: YYYY-MM-DD hh:mm:ss
-        if re.search(r"\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}", line_stripped):
+        if _DATETIME_RE.search(line_stripped):
             # Add to buffer for later processing
             time_buffer.append(line_stripped)
             return
 
         # Check for dots indicating omitted timesteps
-        if re.match(r"^\.+$", line_stripped):
+        if _DOTS_RE.match(line_stripped):
             time_info["has_omitted_timesteps"] = True
             return
 
@@ -466,8 +565,7 @@ class SinfoParser(CDOParser):
         timesteps = []
         for line in time_buffer:
             # Extract all date-time patterns from the line
-            matches = re.findall(r"(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})", line)
-            timesteps.extend(matches)
+            timesteps.extend(_DATETIME_RE.findall(line))
 
         if timesteps:
             time_info["timesteps"] = timesteps
@@ -483,49 +581,26 @@ class SinfoParser(CDOParser):
     @staticmethod
     def _calculate_time_resolution(timesteps: list[str]) -> dict[str, Any]:
         """Calculate time resolution from a sample of timesteps."""
-        from datetime import datetime
-
         resolution_info: dict[str, Any] = {}
 
         try:
-            # Parse first few timesteps
-            dates = [datetime.strptime(ts, "%Y-%m-%d %H:%M:%S") for ts in timesteps[:5]]
-
-            if len(dates) >= 2:
-                # Calculate differences between consecutive timesteps
-                deltas = [
-                    (dates[i + 1] - dates[i]).total_seconds()
-                    for i in range(len(dates) - 1)
-                ]
+            # Parse first few timesteps straight to epoch seconds
+            seconds = np.array(timesteps[:5], dtype="datetime64[s]").astype(np.int64)
 
+            if len(seconds) >= 2:
                 # Check if all deltas are the same (regular spacing)
-                if len(set(deltas)) == 1:
-                    delta_seconds = deltas[0]
+                regular, stride = _stride_check(seconds)
+                if regular:
+                    delta_seconds = float(stride)
                     resolution_info["regular"] = True
                     resolution_info["interval_seconds"] = delta_seconds
 
-                    # Convert to human-readable format
-                    if delta_seconds == 3600:
-                        resolution_info["interval"] = "1 hour"
-                    elif delta_seconds == 86400:
-                        resolution_info["interval"] = "1 day"
-                    elif delta_seconds == 21600:
-                        resolution_info["interval"] = "6 hours"
-                    elif delta_seconds == 43200:
-                        resolution_info["interval"] = "12 hours"
-                    elif delta_seconds % 86400 == 0:
-                        days = int(delta_seconds / 86400)
-                        resolution_info["interval"] = f"{days} days"
-                    elif delta_seconds % 3600 == 0:
-                        hours = int(delta_seconds / 3600)
-                        resolution_info["interval"] = f"{hours} hours"
-                    else:
-                        resolution_info["interval"] = f"{delta_seconds} seconds"
+                    resolution_info["interval"] = _interval_label(delta_seconds)
                 else:
                     resolution_info["regular"] = False
                     resolution_info["interval"] = "irregular"
 
-        except (ValueError, IndexError):
+        except ValueError:
             # If parsing fails, mark as unknown
             resolution_info["regular"] = False
             resolution_info["interval"] = "unknown"
@@ -541,22 +616,16 @@ class SinfoParser(CDOParser):
         Example input: "1 : 2020-01-01 00:00:00  0  518400  1  F64 : tas"
         Format: "Index : Date Time Level Gridsize Num Dtype : Parameter name"
         """
-        # Find the last colon which separates the parameter name
-        last_colon_idx = line.rfind(":")
-        if last_colon_idx == -1:
-            return None
-
-        var_name = line[last_colon_idx + 1 :].strip()
-        if not var_name or var_name in ("Parameter name", ""):
+        # The first colon separates the index, the last one the parameter name
+        _, first_colon, rest = line.partition(":")
+        middle_section, last_colon, var_name = rest.rpartition(":")
+        if not first_colon or not last_colon:
             return None
 
-        # Find the first colon which separates the index
-        first_colon_idx = line.find(":")
-        if first_colon_idx == -1 or first_colon_idx == last_colon_idx:
+        var_name = var_name.strip()
+        if not var_name or var_name == "Parameter name":
             return None
 
-        # Extract the middle section between first and last colons
-        middle_section = line[first_colon_idx + 1 : last_colon_idx].strip()
         fields = middle_section.split()
 
         result: dict[str, Any] = {"name": var_name}
@@ -564,24 +633,8 @@ class SinfoParser(CDOParser):
         # Expected format: Date Time Level Gridsize Num Dtype
         # Example: 2020-01-01 00:00:00 0 518400 1 F64
         if len(fields) >= 6:
-            result["date"] = fields[0]
-            result["time"] = fields[1]
-            # Parse level (can be integer or string like "surface")
-            try:
-                result["level"] = int(fields[2])
-            except ValueError:
-                result["level"] = fields[2]
-            # Parse gridsize (typically an integer)
-            try:
-                result["gridsize"] = int(fields[3])
-            except ValueError:
-                result["gridsize"] = fields[3]
-            # Parse num (typically an integer)
-            try:
-                result["num"] = int(fields[4])
-            except ValueError:
-                result["num"] = fields[4]
-            result["dtype"] = fields[5]
+            for (key, convert), field in zip(_SINFO_COLUMNS_OLD, fields):
+                result[key] = convert(field)
 
         return result
 
@@ -599,8 +652,11 @@ class VlistParser(CDOParser):
         Returns:
             List of dictionaries, each containing variable information.
         """
+        return self.parse_lines(output.splitlines())
+
+    def parse_lines(self, lines: Iterable[str]) -> list[dict[str, Any]]:
+        """Parse vlist output supplied line by line (see ``parse``)."""
         variables = []
-        lines = output.strip().split("\n")
 
         for line in lines:
             line = line.strip()
@@ -639,8 +695,11 @@ class ShowattsParser(CDOParser):
         Returns:
             Dictionary mapping variable names to their attributes.
         """
+        return self.parse_lines(output.splitlines())
+
+    def parse_lines(self, lines: Iterable[str]) -> dict[str, dict[str, Any]]:
+        """Parse showatts output supplied line by line (see ``parse``)."""
         attributes: dict[str, dict[str, Any]] = {}
-        lines = output.strip().split("\n")
 
         current_var = None
         for line in lines:
@@ -657,10 +716,10 @@ class ShowattsParser(CDOParser):
                 continue
 
             # Parse attribute lines
-            if current_var and "=" in line:
-                key, value = line.split("=", 1)
-                key = key.strip()
-                value = value.strip().strip('"').strip("'")
+            key, eq, value = line.partition("=")
+            if current_var and eq:
+                key = key.rstrip()
+                value = _strip_quotes(value.lstrip())
                 attributes[current_var][key] = value
 
         return attributes
@@ -679,31 +738,44 @@ class PartabParser(CDOParser):
         Returns:
             List of dictionaries containing parameter information.
         """
+        return self.parse_lines(output.splitlines())
+
+    def parse_lines(self, lines: Iterable[str]) -> list[dict[str, Any]]:
+        """Parse partab output supplied line by line (see ``parse``)."""
         parameters = []
-        lines = output.strip().split("\n")
 
-        for line in lines:
-            line = line.strip()
+        for raw in lines:
+            line = raw.strip()
             if not line or line.startswith("#"):
                 continue
 
-            # Parse parameter table lines
-            param_info = self._parse_parameter_line(line)
+            # Tables are usually pipe- or space-separated throughout, but
+            # decide per line so mixed tables keep every row
+            param_info = self._parse_parameter_line(line, "|" in line)
             if param_info:
                 parameters.append(param_info)
 
         return parameters
 
     @staticmethod
-    def _parse_parameter_line(line: str) -> dict[str, Any] | None:
-        """Parse a parameter line from partab output."""
+    def _parse_parameter_line(
+        line: str, pipe_separated: bool | None = None
+    ) -> dict[str, Any] | None:
+        """
+        Parse a parameter line from partab output.
+
+        Args:
+            line: Stripped line to parse.
+            pipe_separated: Whether the table uses "|" separators. If None,
+                it is detected from the line itself.
+        """
+        if pipe_separated is None:
+            pipe_separated = "|" in line
+
         # Example format: code | name | units | description
-        parts = [p.strip() for p in line.split("|")]
-        if len(parts) < 2:
-            # Try space-separated
-            parts = line.split()
-            if not parts:
-                return None
+        parts = [p.strip() for p in line.split("|")] if pipe_separated else line.split()
+        if not parts:
+            return None
 
         result: dict[str, Any] = {"raw": line}
         if len(parts) >= 1:
@@ -731,21 +803,20 @@ class VctParser(CDOParser):
         Returns:
             Dictionary with VCT values as arrays.
         """
-        vct_values = []
-        lines = output.strip().split("\n")
-
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-
-            # Parse numeric values
-            for part in line.split():
-                try:
-                    vct_values.append(float(part))
-                except ValueError:
-                    continue
-
+        # vct usually prints a single (newline-terminated) line of values;
+        # skip the line filtering for it
+        body = output.strip()
+        if "\n" not in body and not body.startswith("#"):
+            return {"vct": _parse_float_array(body)}
+        return self.parse_lines(output.splitlines())
+
+    def parse_lines(self, lines: Iterable[str]) -> dict[str, list[float]]:
+        """Parse vct output supplied line by line (see ``parse``)."""
+        vct_values: list[float] = []
+        for raw in lines:
+            line = raw.strip()
+            if line and not line.startswith("#"):
+                vct_values.extend(_parse_float_array(line))
         return {"vct": vct_values}
 
 
@@ -768,9 +839,49 @@ PARSER_REGISTRY: dict[str, type[CDOParser]] = {
     "vct2": VctParser,
 }
 
+# Parsers are stateless, so each registered class is instantiated once, on
+# first use. Keyed by class so commands added to PARSER_REGISTRY later work.
+_PARSER_INSTANCES: dict[type[CDOParser], CDOParser] = {}
+
+
+@lru_cache(maxsize=256)
+def _operator_name(command: str) -> str | None:
+    """Extract the lower-cased operator name from a CDO command string."""
+    cmd_parts = command.split(None, 1)
+    if not cmd_parts:
+        return None
+    return cmd_parts[0].lstrip("-").split(",", 1)[0].lower()
+
+
+def _resolve_parser(command: str) -> tuple[str | None, CDOParser | None]:
+    """
+    Resolve a CDO command string to its operator name and parser instance.
+
+    Returns (None, None) for an empty command and (operator, None) when no
+    parser is registered for the operator.
+    """
+    operator = _operator_name(command)
+    if operator is None:
+        return None, None
+    parser_class = PARSER_REGISTRY.get(operator)
+    if parser_class is None:
+        return operator, None
+    parser = _PARSER_INSTANCES.get(parser_class)
+    if parser is None:
+        parser = _PARSER_INSTANCES.setdefault(parser_class, parser_class())
+    return operator, parser
+
+
+# Opt-in cache of parsed results, keyed by operator and a digest of the output
+_PARSE_CACHE_MAXSIZE = 128
+_PARSE_CACHE: OrderedDict[tuple[str, bytes], dict[str, Any] | list[dict[str, Any]]] = (
+    OrderedDict()
+)
+_PARSE_CACHE_LOCK = threading.Lock()
+
 
 def parse_cdo_output(
-    command: str, output: str
+    command: str, output: str, *, cache: bool = False
 ) -> dict[str, Any] | list[dict[str, Any]]:
     """
     Parse CDO command output into structured data.
@@ -778,6 +889,9 @@ def parse_cdo_output(
     Args:
         command: The CDO command that was executed.
         output: The raw text output from the command.
+        cache: If True, reuse the result of an earlier call with the same
+            operator and identical output. Cached results are shared between
+            callers and must be treated as read-only.
 
     Returns:
         Parsed structured data as dict or list of dicts.
@@ -791,20 +905,70 @@ def parse_cdo_output(
         >>> print(parsed["gridtype"])
         lonlat
     """
-    # Extract the operator name from the command
-    cmd_parts = command.strip().split()
-    if not cmd_parts:
+    # Resolve operator name and parser in one cached lookup
+    operator, parser = _resolve_parser(command)
+    if operator is None:
         raise ValueError("Empty command")
+    if parser is None:
+        raise ValueError(f"No parser available for command: {operator}")
 
-    operator = cmd_parts[0].lstrip("-").split(",")[0].lower()
+    # Blank output parses to the parser's empty result; skip splitting and hashing
+    if not output or output.isspace():
+        return parser.parse_lines(())
 
-    # Get the appropriate parser
-    parser_class = PARSER_REGISTRY.get(operator)
-    if parser_class is None:
+    if not cache:
+        return parser.parse(output)
+
+    key = (operator, blake2b(output.encode(), digest_size=16).digest())
+    with _PARSE_CACHE_LOCK:
+        result = _PARSE_CACHE.get(key)
+        if result is not None:
+            _PARSE_CACHE.move_to_end(key)
+            return result
+
+    # Parse outside the lock; a concurrent miss on the same key just parses twice
+    result = parser.parse(output)
+    with _PARSE_CACHE_LOCK:
+        _PARSE_CACHE[key] = result
+        if len(_PARSE_CACHE) > _PARSE_CACHE_MAXSIZE:
+            _PARSE_CACHE.popitem(last=False)
+    return result
+
+
+def parse_cdo_output_file(
+    command: str, path: str | os.PathLike[str], *, encoding: str = "utf-8"
+) -> dict[str, Any] | list[dict[str, Any]]:
+    """
+    Parse CDO command output that was captured to a file.
+
+    The file is streamed to the parser line by line, so large outputs (e.g.
+    sinfo of a long time series) are never held in memory as one string.
+
+    Args:
+        command: The CDO command that was executed.
+        path: Path of the file holding the raw text output.
+        encoding: Text encoding of the file. Undecodable bytes are replaced
+            rather than raising.
+
+    Returns:
+        Parsed structured data as dict or list of dicts.
+
+    Raises:
+        ValueError: If no parser is available for the command.
+
+    Example:
+        >>> parsed = parse_cdo_output_file("sinfo", "sinfo.txt")
+        >>> print(parsed["metadata"]["format"])
+        NetCDF4
+    """
+    operator, parser = _resolve_parser(command)
+    if operator is None:
+        raise ValueError("Empty command")
+    if parser is None:
         raise ValueError(f"No parser available for command: {operator}")
 
-    parser = parser_class()
-    return parser.parse(output)
+    with Path(path).open(encoding=encoding, errors="replace") as f:
+        return parser.parse_lines(line.rstrip("\n") for line in f)
 
 
 def get_supported_structured_commands() -> frozenset[str]:
@@ -0,0 +1,9 @@
+"""Internal compatibility helpers shared by the type definitions."""
+
+from __future__ import annotations
+
+import sys
+from typing import Any
+
+# Slotted dataclasses need Python 3.10+; older interpreters get regular ones
+_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
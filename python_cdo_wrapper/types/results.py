@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+from typing import Any
 
+from ._compat import _SLOTS
 from .grid import GridInfo, ZaxisInfo  # noqa: TC001
 from .variable import (  # noqa: TC001
     DatasetVariable,
@@ -55,6 +57,15 @@ class SinfoResult:
         """Get primary vertical coordinates (first if multiple)."""
         return self.vertical_coordinates[0] if self.vertical_coordinates else None
 
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Convert the result to plain dictionaries and lists.
+
+        Returns:
+            Nested dictionary with the same fields as this dataclass.
+        """
+        return asdict(self)
+
 
 @dataclass
 class InfoResult:
@@ -82,9 +93,14 @@ class InfoResult:
         return self.timesteps[-1] if self.timesteps else None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TimestepInfo:
-    """Information for a single timestep from info output."""
+    """
+    Information for a single timestep from info output.
+
+    One instance is created per info row, so the class uses ``__slots__``
+    (on Python 3.10+) to keep long time series compact.
+    """
 
     timestep: int
     date: str
@@ -123,6 +139,15 @@ class GriddesResult:
         """Get primary grid (first grid if multiple)."""
         return self.grids[0] if self.grids else None
 
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Convert the result to plain dictionaries and lists.
+
+        Returns:
+            Nested dictionary with the same fields as this dataclass.
+        """
+        return asdict(self)
+
 
 @dataclass
 class ZaxisdesResult:
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from ._compat import _SLOTS
+
 
 @dataclass
 class VariableInfo:
@@ -91,9 +93,14 @@ class VerticalCoordinates:
     level_values: list[float] | None = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DatasetVariable:
-    """Variable information from sinfo output."""
+    """
+    Variable information from sinfo output.
+
+    One instance is created per variable row, so the class uses ``__slots__``
+    (on Python 3.10+) to keep large sinfo results compact.
+    """
 
     var_id: int
     institut: str
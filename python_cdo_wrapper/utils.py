@@ -5,12 +5,46 @@ from __future__ import annotations
 import subprocess
 import tempfile
 from pathlib import Path
+from sys import intern
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from typing import Any
 
 
+# Low-cardinality values that recur across records (dtypes, grid/axis types,
+# units, calendars, ...). Only these are interned, so the interpreter's intern
+# table stays bounded no matter what a CDO build prints.
+_INTERN = frozenset(
+    {
+        # data types
+        "F32", "F64", "I8", "I16", "I32", "U8", "U16", "U32", "P0", "P8", "P16",
+        # grid and vertical axis types
+        "lonlat", "gaussian", "gaussian_reduced", "curvilinear", "unstructured",
+        "projection", "generic", "surface", "pressure", "hybrid", "height",
+        "depth_below_sea", "depth_below_land", "isentropic", "reference",
+        # step types and sentinel values
+        "instant", "avg", "accum", "min", "max", "range", "unknown", "v", "c",
+        # file formats
+        "GRIB", "GRIB2", "NetCDF", "NetCDF2", "NetCDF4", "NetCDF4c", "NetCDF5",
+        "SERVICE", "EXTRA", "IEG",
+        # units
+        "degrees_east", "degrees_north", "degrees", "radian", "m", "km", "Pa",
+        "hPa", "K", "seconds", "minutes", "hours", "days", "months", "years",
+        # calendars
+        "standard", "gregorian", "proleptic_gregorian", "julian", "360_day",
+        "365_day", "366_day", "noleap", "all_leap",
+        # times of day
+        "00:00:00", "06:00:00", "12:00:00", "18:00:00",
+    }
+)  # fmt: skip
+
+
+def _intern(value: str) -> str:
+    """Return the interned copy of a known low-cardinality value."""
+    return intern(value) if value in _INTERN else value
+
+
 def create_temp_file(
     suffix: str = ".nc", prefix: str = "cdo_", dir: str | Path | None = None
 ) -> Path:
@@ -2,6 +2,8 @@
 Pytest configuration and fixtures for python-cdo-wrapper tests.
 """
 
+import functools
+import os
 import subprocess
 from pathlib import Path
 
@@ -18,8 +20,18 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "slow: mark test as slow running")
 
 
+@functools.cache
 def is_cdo_installed() -> bool:
-    """Check if CDO is installed on the system."""
+    """
+    Check if CDO is installed on the system.
+
+    The result is cached for the session. Set ``CDO_INSTALLED=1`` or
+    ``CDO_INSTALLED=0`` to skip the ``cdo -V`` probe entirely (e.g. in CI).
+    """
+    override = os.environ.get("CDO_INSTALLED")
+    if override is not None:
+        return override == "1"
+
     try:
         result = subprocess.run(
             ["cdo", "-V"],
@@ -42,8 +54,8 @@ def pytest_collection_modifyitems(config, items):  # noqa: ARG001
                 item.add_marker(skip_integration)
 
 
-@pytest.fixture
-def sample_nc_file(tmp_path: Path) -> Path:
+@pytest.fixture(scope="session")
+def sample_nc_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """
     Create a minimal NetCDF file for testing.
 
@@ -52,6 +64,9 @@ def sample_nc_file(tmp_path: Path) -> Path:
     - 3 time steps
     - 4x4 lat/lon grid
 
+    The file is written once per session and shared between tests, so
+    tests must treat it as read-only and write outputs elsewhere.
+
     Returns:
         Path to the temporary NetCDF file.
     """
@@ -60,9 +75,8 @@ def sample_nc_file(tmp_path: Path) -> Path:
     lats = np.linspace(-90, 90, 4)
     lons = np.linspace(-180, 180, 4)
 
-    # Random temperature data
-    np.random.seed(42)
-    temp = np.random.rand(3, 4, 4) * 30 + 270  # 270-300 K
+    # Deterministic temperature data (270-317 K)
+    temp = np.arange(48, dtype="f4").reshape(3, 4, 4) + 270.0
 
     ds = xr.Dataset(
         {
@@ -117,14 +131,14 @@ def sample_nc_file(tmp_path: Path) -> Path:
         "lon": {"dtype": "float32"},
     }
 
-    filepath = tmp_path / "test_data.nc"
+    filepath = tmp_path_factory.mktemp("nc") / "test_data.nc"
     ds.to_netcdf(filepath, format="NETCDF4_CLASSIC", encoding=encoding)
 
     return filepath
 
 
-@pytest.fixture
-def sample_nc_file_with_time(tmp_path: Path) -> Path:
+@pytest.fixture(scope="session")
+def sample_nc_file_with_time(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """
     Create a NetCDF file with proper datetime coordinates.
 
@@ -132,6 +146,9 @@ def sample_nc_file_with_time(tmp_path: Path) -> Path:
     - 12 monthly time steps
     - Proper datetime coordinates
 
+    The file is written once per session and shared between tests, so
+    tests must treat it as read-only and write outputs elsewhere.
+
     Returns:
         Path to the temporary NetCDF file.
     """
@@ -142,9 +159,8 @@ def sample_nc_file_with_time(tmp_path: Path) -> Path:
     lats = np.linspace(-90, 90, 4)
     lons = np.linspace(-180, 180, 4)
 
-    # Random temperature data
-    np.random.seed(42)
-    temp = np.random.rand(12, 4, 4) * 30 + 270
+    # Deterministic temperature data (270-461 K)
+    temp = np.arange(192, dtype="f4").reshape(12, 4, 4) + 270.0
 
     ds = xr.Dataset(
         {
@@ -198,7 +214,7 @@ def sample_nc_file_with_time(tmp_path: Path) -> Path:
         "lon": {"dtype": "float32"},
     }
 
-    filepath = tmp_path / "test_data_time.nc"
+    filepath = tmp_path_factory.mktemp("nc") / "test_data_time.nc"
     ds.to_netcdf(filepath, format="NETCDF4_CLASSIC", encoding=encoding)
 
     return filepath
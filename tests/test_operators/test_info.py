@@ -15,6 +15,7 @@ from python_cdo_wrapper.operators.info import (
     VlistOperator,
     ZaxisdesOperator,
 )
+from python_cdo_wrapper.parsers.info import SinfoParser
 
 # Sample CDO outputs for mocking
 SAMPLE_SINFO = """   File format : NetCDF4
@@ -91,6 +92,15 @@ class TestSinfoOperator:
         assert result.nvar == 1
         assert len(result.grid_coordinates) == 1
 
+    def test_parse_output_reuses_parser(self):
+        """Test that two operator calls parse with the same parser instance."""
+        with patch.object(SinfoParser, "parse", autospec=True) as mock_parse:
+            SinfoOperator().parse_output(SAMPLE_SINFO)
+            SinfoOperator().parse_output(SAMPLE_SINFO)
+
+        first, second = (c.args[0] for c in mock_parse.call_args_list)
+        assert first is second
+
     def test_cdo_sinfo_method_with_mock(self):
         """Test CDO.sinfo() method with mocked subprocess."""
         cdo = CDO()
@@ -41,3 +41,10 @@ class TestPackageAPI:
 
         assert callable(cdo)
         assert isinstance(CDO_TEXT_COMMANDS, frozenset)
+
+    def test_parsers_package_reexports_legacy_dispatch(self):
+        """Test parsers package shares the legacy dispatch functions."""
+        from python_cdo_wrapper import parsers
+
+        assert parsers.parse_cdo_output is python_cdo_wrapper.parse_cdo_output
+        assert "griddes" in parsers.get_supported_structured_commands()
@@ -217,6 +217,28 @@ class TestGriddesParser:
         assert lat_range[0] == 6.625
         assert abs(lat_range[1] - 38.625) < 0.01
 
+    def test_griddes_result_as_dict(self):
+        """Test GriddesResult.as_dict conversion."""
+        parser = GriddesParser()
+        result = parser.parse(SAMPLE_GRIDDES_OUTPUT)
+
+        data = result.as_dict()
+        assert data["grids"][0]["gridtype"] == "lonlat"
+        assert data["grids"][0]["xsize"] == 135
+
+    def test_parse_number_lists(self):
+        """Test xvals/rowlon lists and the raw fallback for malformed values."""
+        output = SAMPLE_GRIDDES_GAUSSIAN_REDUCED.replace(
+            "yname     = lat\n",
+            "yname     = lat\nrowlon    = 20 24 28\nyvals     = 1.5 -2.5 bad\n",
+        )
+        parser = GriddesParser()
+        grid = parser.parse(output).primary_grid
+
+        assert grid.rowlon == [20, 24, 28]
+        assert grid.yvals is None
+        assert grid.raw_attributes == {"yvals": "1.5 -2.5 bad"}
+
     def test_parse_invalid_output_raises(self):
         """Test that invalid output raises CDOParseError."""
         parser = GriddesParser()
@@ -406,6 +428,26 @@ class TestZaxisdesParser:
         assert zaxis.levels == [100000.0, 85000.0, 50000.0]
         assert zaxis.is_surface is False
 
+    def test_parse_skips_indented_comments(self):
+        """Test that indented comments and log lines are not read as attributes."""
+        output = SAMPLE_ZAXISDES_OUTPUT.replace(
+            "levels    = 0\n", "levels    = 0\n  # name = ignored\n"
+        )
+        parser = ZaxisdesParser()
+        result = parser.parse(output)
+
+        zaxis = result.primary_zaxis
+        assert zaxis.name == "sfc"
+        assert zaxis.levels == [0.0]
+
+    def test_parse_malformed_levels(self):
+        """Test that a malformed levels list yields an empty list."""
+        output = SAMPLE_ZAXISDES_PRESSURE.replace("50000", "fifty")
+        parser = ZaxisdesParser()
+        result = parser.parse(output)
+
+        assert result.primary_zaxis.levels == []
+
     def test_zaxis_info_properties(self):
         """Test ZaxisInfo properties."""
         parser = ZaxisdesParser()
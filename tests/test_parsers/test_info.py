@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import sys
+
 import pytest
 
 from python_cdo_wrapper.exceptions import CDOParseError
@@ -89,6 +91,46 @@ class TestSinfoParser:
             result.var_names == []
         )  # Should return empty list when no names available
 
+    def test_parse_multiple_variables(self):
+        """Test parsing several variable rows, skipping malformed ones."""
+        output = SAMPLE_SINFO_OUTPUT.replace(
+            "     1 : unknown  unknown  v instant       1   1     17415   1  F32  : -1\n",
+            "     1 : unknown  unknown  v instant       1   1     17415   1  F32  : -1\n"
+            "     2 : ECMWF    IFS      v avg          19   2     17415   1  F64  : 130\n"
+            "     3 : broken row\n",
+        )
+        parser = SinfoParser()
+        result = parser.parse(output)
+
+        assert [v.var_id for v in result.variables] == [1, 2]
+        var = result.variables[1]
+        assert var.institut == "ECMWF"
+        assert var.steptype == "avg"
+        assert var.levels == 19
+        assert var.dtype == "F64"
+        assert var.param_id == 130
+
+    def test_parse_interns_known_values(self):
+        """Test that recurring low-cardinality values share one string object."""
+        parser = SinfoParser()
+        result = parser.parse(SAMPLE_SINFO_OUTPUT)
+
+        var = result.variables[0]
+        assert var.dtype is sys.intern("F32")
+        assert var.steptype is sys.intern("instant")
+        assert result.grid_coordinates[0].gridtype is sys.intern("lonlat")
+        assert result.grid_coordinates[0].longitude_units is sys.intern("degrees_east")
+
+    @pytest.mark.skipif(
+        sys.version_info < (3, 10), reason="slotted dataclasses need 3.10+"
+    )
+    def test_variables_use_slots(self):
+        """Test that per-variable records carry no instance __dict__."""
+        parser = SinfoParser()
+        result = parser.parse(SAMPLE_SINFO_OUTPUT)
+
+        assert not hasattr(result.variables[0], "__dict__")
+
     def test_parse_grid_coordinates(self):
         """Test parsing grid coordinates."""
         parser = SinfoParser()
@@ -110,6 +152,21 @@ class TestSinfoParser:
         assert grid.latitude_inc == 0.25
         assert grid.latitude_units == "degrees_north"
 
+    def test_parse_grid_coordinates_per_grid(self):
+        """Test that coordinate lines bind to their own grid, incl. negatives."""
+        output = SAMPLE_SINFO_OUTPUT.replace(
+            "     1 : lonlat                   : points=17415 (135x129)\n",
+            "     1 : generic                  : points=4 (2x2)\n"
+            "     2 : lonlat                   : points=17415 (135x129)\n",
+        ).replace("66.625 to 100.125", "-66.625 to 100.125")
+        parser = SinfoParser()
+        result = parser.parse(output)
+
+        generic, lonlat = result.grid_coordinates
+        assert generic.longitude_start is None
+        assert lonlat.longitude_start == -66.625
+        assert lonlat.latitude_units == "degrees_north"
+
     def test_parse_vertical_coordinates(self):
         """Test parsing vertical coordinates."""
         parser = SinfoParser()
@@ -146,6 +203,16 @@ class TestSinfoParser:
         assert result.primary_vertical is not None
         assert result.primary_vertical.zaxistype == "surface"
 
+    def test_sinfo_result_as_dict(self):
+        """Test SinfoResult.as_dict conversion."""
+        parser = SinfoParser()
+        result = parser.parse(SAMPLE_SINFO_OUTPUT)
+
+        data = result.as_dict()
+        assert data["file_format"] == "NetCDF4"
+        assert data["variables"][0]["dtype"] == "F32"
+        assert data["time_info"]["ntime"] == 15340
+
     def test_parse_invalid_output_raises(self):
         """Test that invalid output raises CDOParseError."""
         parser = SinfoParser()
@@ -182,6 +249,16 @@ class TestInfoParser:
         assert ts.maximum == 0.0
         assert ts.param_id == -1
 
+    @pytest.mark.skipif(
+        sys.version_info < (3, 10), reason="slotted dataclasses need 3.10+"
+    )
+    def test_timesteps_use_slots(self):
+        """Test that per-timestep records carry no instance __dict__."""
+        parser = InfoParser()
+        result = parser.parse(SAMPLE_INFO_OUTPUT)
+
+        assert not hasattr(result.timesteps[0], "__dict__")
+
     def test_info_result_properties(self):
         """Test InfoResult properties."""
         parser = InfoParser()
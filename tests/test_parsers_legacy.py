@@ -8,6 +8,13 @@ the test_parsers/ directory. If pytest shows import errors, this file
 should be renamed to test_parsers_legacy.py.
 """
 
+import io
+import json
+import math
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from textwrap import dedent
+
 import pytest
 
 # These imports resolve to the legacy parsers.py module via special
@@ -22,26 +29,160 @@ from python_cdo_wrapper import (
     ZaxisdesParser,
     get_supported_structured_commands,
     parse_cdo_output,
+    parse_cdo_output_file,
 )
+from python_cdo_wrapper.parsers_legacy import PARSER_REGISTRY, _coerce
+
+_SUPPORTED = get_supported_structured_commands()
+
+SAMPLE_GRIDDES_LONLAT_OUTPUT = dedent(
+    """
+    gridtype = lonlat
+    gridsize = 64800
+    xsize = 360
+    ysize = 180
+    xfirst = -179.5
+    xinc = 1.0
+    yfirst = -89.5
+    yinc = 1.0
+    """
+).strip()
+
+SAMPLE_ZAXIS_PRESSURE_OUTPUT = dedent(
+    """
+    zaxistype = pressure
+    size = 4
+    levels = 1000 850 500 250
+    """
+).strip()
+
+SAMPLE_ZAXIS_HYBRID_OUTPUT = dedent(
+    """
+    zaxistype = hybrid
+    size = 3
+    vctsize = 6
+    vct = 0.0 0.1 0.5 1.0 2.0 3.0
+    """
+).strip()
+
+SAMPLE_SINFO_BASIC_OUTPUT = """
+File format: NetCDF
+   -1 : Date     Time   Level Gridsize    Num    Dtype : Parameter name
+    1 : 2020-01-01 00:00:00       0   518400      1  F64    : tas
+    2 : 2020-01-01 00:00:00       0   518400      2  F64    : pr
+""".strip()
+
+SAMPLE_SINFO_TEMPORAL_OUTPUT = """
+File format: NetCDF4
+   -1 : Date     Time   Level Gridsize    Num    Dtype : Parameter name
+    1 : 1901-01-01 00:00:00       0   135360      1  F32    : rf
+    2 : 1901-01-02 00:00:00       0   135360      1  F32    : rf
+    3 : 1901-01-03 00:00:00       0   135360      1  F32    : rf
+    4 : 2019-12-31 00:00:00       0   135360      1  F32    : rf
+""".strip()
+
+SAMPLE_SINFO_COMPLETE_OUTPUT = """File format : NetCDF4
+    -1 : Institut Source   T Steptype Levels Num    Points Num Dtype : Parameter ID
+     1 : unknown  unknown  v instant       1   1     17415   1  F32  : 260
+   Grid coordinates :
+     1 : lonlat                   : points=17415 (135x129)
+                              lon : 66.5 to 100 by 0.25 [degrees_east]
+                              lat : 6.5 to 38.5 by 0.25 [degrees_north]
+   Vertical coordinates :
+     1 : surface                  : levels=1
+   Time coordinate :
+                             time : 43464 steps
+     RefTime =  1901-01-01 00:00:00  Units = hours  Calendar = standard
+  YYYY-MM-DD hh:mm:ss  YYYY-MM-DD hh:mm:ss  YYYY-MM-DD hh:mm:ss  YYYY-MM-DD hh:mm:ss
+  1901-01-01 00:00:00  1901-01-02 00:00:00  1901-01-03 00:00:00  1901-01-04 00:00:00
+  1901-01-05 00:00:00  1901-01-06 00:00:00  1901-01-07 00:00:00  1901-01-08 00:00:00
+  ................................................................................
+  2019-12-28 00:00:00  2019-12-29 00:00:00  2019-12-30 00:00:00  2019-12-31 00:00:00
+""".strip()
+
+EXPECTED_SINFO_BASIC_VARIABLES = [
+    {
+        "name": "tas",
+        "date": "2020-01-01",
+        "time": "00:00:00",
+        "level": 0,
+        "gridsize": 518400,
+        "num": 1,
+        "dtype": "F64",
+    },
+    {
+        "name": "pr",
+        "date": "2020-01-01",
+        "time": "00:00:00",
+        "level": 0,
+        "gridsize": 518400,
+        "num": 2,
+        "dtype": "F64",
+    },
+]
+
+EXPECTED_SINFO_TEMPORAL_VARIABLES = [
+    {
+        "name": "rf",
+        "date": date,
+        "time": "00:00:00",
+        "level": 0,
+        "gridsize": 135360,
+        "num": 1,
+        "dtype": "F32",
+    }
+    for date in ("1901-01-01", "1901-01-02", "1901-01-03", "2019-12-31")
+]
+
+
+@pytest.fixture(scope="module")
+def griddes_parser():
+    """Shared GriddesParser instance (parsers are stateless)."""
+    return GriddesParser()
+
+
+@pytest.fixture(scope="module")
+def zaxisdes_parser():
+    """Shared ZaxisdesParser instance (parsers are stateless)."""
+    return ZaxisdesParser()
+
+
+@pytest.fixture(scope="module")
+def sinfo_parser():
+    """Shared SinfoParser instance (parsers are stateless)."""
+    return SinfoParser()
+
+
+@pytest.fixture(scope="module")
+def vlist_parser():
+    """Shared VlistParser instance (parsers are stateless)."""
+    return VlistParser()
+
+
+@pytest.fixture(scope="module")
+def partab_parser():
+    """Shared PartabParser instance (parsers are stateless)."""
+    return PartabParser()
+
+
+@pytest.fixture(scope="module")
+def vct_parser():
+    """Shared VctParser instance (parsers are stateless)."""
+    return VctParser()
+
+
+@pytest.fixture(scope="module")
+def showatts_parser():
+    """Shared ShowattsParser instance (parsers are stateless)."""
+    return ShowattsParser()
 
 
 class TestGriddesParser:
     """Tests for GriddesParser."""
 
-    def test_parse_lonlat_grid(self):
+    def test_parse_lonlat_grid(self, griddes_parser):
         """Test parsing a regular lon-lat grid."""
-        output = """
-gridtype = lonlat
-gridsize = 64800
-xsize = 360
-ysize = 180
-xfirst = -179.5
-xinc = 1.0
-yfirst = -89.5
-yinc = 1.0
-        """
-        parser = GriddesParser()
-        result = parser.parse(output)
+        result = griddes_parser.parse(SAMPLE_GRIDDES_LONLAT_OUTPUT)
 
         assert result["gridtype"] == "lonlat"
         assert result["gridsize"] == 64800
@@ -52,7 +193,7 @@ yinc = 1.0
         assert result["yfirst"] == -89.5
         assert result["yinc"] == 1.0
 
-    def test_parse_grid_with_comments(self):
+    def test_parse_grid_with_comments(self, griddes_parser):
         """Test parsing grid with comment lines."""
         output = """
 # Grid description
@@ -61,41 +202,55 @@ gridsize = 100
 xsize = 10
 ysize = 10
         """
-        parser = GriddesParser()
-        result = parser.parse(output)
+        result = griddes_parser.parse(output)
 
         assert result["gridtype"] == "lonlat"
         assert result["gridsize"] == 100
         assert "# Grid description" not in result
 
+    def test_parse_quoted_values(self, griddes_parser):
+        """Test that quoted string attributes are unquoted but not coerced."""
+        output = """
+gridtype = lonlat
+xlongname = "longitude"
+xname = 'lon'
+comment = "42"
+        """
+        result = griddes_parser.parse(output)
+
+        assert result["xlongname"] == "longitude"
+        assert result["xname"] == "lon"
+        assert result["comment"] == "42"
+
+    def test_parse_coordinate_arrays(self, griddes_parser):
+        """Test that xvals/yvals are parsed as float arrays."""
+        output = """
+gridtype = generic
+gridsize = 6
+xvals = 0 120 240
+yvals = -45.5 45.5
+        """
+        result = griddes_parser.parse(output)
+
+        assert result["gridsize"] == 6
+        assert result["xvals"] == [0.0, 120.0, 240.0]
+        assert result["yvals"] == [-45.5, 45.5]
+
 
 class TestZaxisdesParser:
     """Tests for ZaxisdesParser."""
 
-    def test_parse_pressure_levels(self):
+    def test_parse_pressure_levels(self, zaxisdes_parser):
         """Test parsing pressure level axis."""
-        output = """
-zaxistype = pressure
-size = 4
-levels = 1000 850 500 250
-        """
-        parser = ZaxisdesParser()
-        result = parser.parse(output)
+        result = zaxisdes_parser.parse(SAMPLE_ZAXIS_PRESSURE_OUTPUT)
 
         assert result["zaxistype"] == "pressure"
         assert result["size"] == 4
         assert result["levels"] == [1000.0, 850.0, 500.0, 250.0]
 
-    def test_parse_with_vct(self):
+    def test_parse_with_vct(self, zaxisdes_parser):
         """Test parsing axis with vertical coordinate table."""
-        output = """
-zaxistype = hybrid
-size = 3
-vctsize = 6
-vct = 0.0 0.1 0.5 1.0 2.0 3.0
-        """
-        parser = ZaxisdesParser()
-        result = parser.parse(output)
+        result = zaxisdes_parser.parse(SAMPLE_ZAXIS_HYBRID_OUTPUT)
 
         assert result["zaxistype"] == "hybrid"
         assert result["size"] == 3
@@ -106,94 +261,56 @@ vct = 0.0 0.1 0.5 1.0 2.0 3.0
 class TestSinfoParser:
     """Tests for SinfoParser."""
 
-    def test_parse_basic_info(self):
+    def test_parse_basic_info(self, sinfo_parser):
         """Test parsing basic dataset information."""
-        output = """
-File format: NetCDF
-   -1 : Date     Time   Level Gridsize    Num    Dtype : Parameter name
-    1 : 2020-01-01 00:00:00       0   518400      1  F64    : tas
-    2 : 2020-01-01 00:00:00       0   518400      2  F64    : pr
-        """
-        parser = SinfoParser()
-        result = parser.parse(output)
+        result = sinfo_parser.parse(SAMPLE_SINFO_BASIC_OUTPUT)
 
-        assert "metadata" in result
         assert result["metadata"]["format"] == "NetCDF"
-        assert "variables" in result
-        assert len(result["variables"]) == 2
+        assert result["variables"] == EXPECTED_SINFO_BASIC_VARIABLES
 
-        # Test first variable (tas)
-        assert result["variables"][0]["name"] == "tas"
-        assert result["variables"][0]["date"] == "2020-01-01"
-        assert result["variables"][0]["time"] == "00:00:00"
-        assert result["variables"][0]["level"] == 0
-        assert result["variables"][0]["gridsize"] == 518400
-        assert result["variables"][0]["num"] == 1
-        assert result["variables"][0]["dtype"] == "F64"
-
-        # Test second variable (pr)
-        assert result["variables"][1]["name"] == "pr"
-        assert result["variables"][1]["date"] == "2020-01-01"
-        assert result["variables"][1]["time"] == "00:00:00"
-        assert result["variables"][1]["level"] == 0
-        assert result["variables"][1]["gridsize"] == 518400
-        assert result["variables"][1]["num"] == 2
-        assert result["variables"][1]["dtype"] == "F64"
-
-    def test_parse_empty_variables(self):
+    def test_parse_empty_variables(self, sinfo_parser):
         """Test parsing info with no variables."""
         output = """
 File format: NetCDF
    -1 : Date     Time   Level Gridsize    Num    Dtype : Parameter name
         """
-        parser = SinfoParser()
-        result = parser.parse(output)
+        result = sinfo_parser.parse(output)
 
         assert "variables" in result
         assert len(result["variables"]) == 0
 
-    def test_parse_temporal_data(self):
+    def test_parse_temporal_data(self, sinfo_parser):
         """Test parsing temporal information from multiple timesteps."""
-        output = """
-File format: NetCDF4
-   -1 : Date     Time   Level Gridsize    Num    Dtype : Parameter name
-    1 : 1901-01-01 00:00:00       0   135360      1  F32    : rf
-    2 : 1901-01-02 00:00:00       0   135360      1  F32    : rf
-    3 : 1901-01-03 00:00:00       0   135360      1  F32    : rf
-    4 : 2019-12-31 00:00:00       0   135360      1  F32    : rf
-        """
-        parser = SinfoParser()
-        result = parser.parse(output)
+        result = sinfo_parser.parse(SAMPLE_SINFO_TEMPORAL_OUTPUT)
 
-        assert "metadata" in result
         assert result["metadata"]["format"] == "NetCDF4"
-        assert "variables" in result
-        assert len(result["variables"]) == 4
-
-        # Test first timestep
-        assert result["variables"][0]["name"] == "rf"
-        assert result["variables"][0]["date"] == "1901-01-01"
-        assert result["variables"][0]["time"] == "00:00:00"
-
-        # Test last timestep
-        assert result["variables"][3]["name"] == "rf"
-        assert result["variables"][3]["date"] == "2019-12-31"
-        assert result["variables"][3]["time"] == "00:00:00"
+        assert result["variables"] == EXPECTED_SINFO_TEMPORAL_VARIABLES
+
+        # Low-cardinality fields share one interned string object
+        assert result["variables"][0]["dtype"] is result["variables"][3]["dtype"]
+
+    def test_parse_does_not_intern_unknown_values(self, sinfo_parser):
+        """Test that only known low-cardinality values are interned."""
+        sys.intern("my_institute")
+        output = (
+            "    -1 : Institut Source   T Steptype Levels Num    Points Num Dtype"
+            " : Parameter ID\n"
+            "     1 : my_institute  unknown  v instant  1   1  17415   1  F32  : 260"
+        )
+        var = sinfo_parser.parse(output)["variables"][0]
 
-        # Verify all have consistent gridsize and dtype
-        for var in result["variables"]:
-            assert var["gridsize"] == 135360
-            assert var["dtype"] == "F32"
+        assert var["institut"] == "my_institute"
+        assert var["institut"] is not sys.intern("my_institute")
+        assert var["dtype"] is sys.intern("F32")
 
-    def test_parse_with_string_level(self):
+    def test_parse_with_string_level(self, sinfo_parser):
         """Test parsing when level is a string (e.g., 'surface')."""
         output = """
 File format: NetCDF
    -1 : Date     Time   Level Gridsize    Num    Dtype : Parameter name
     1 : 2020-01-01 00:00:00 surface 10000      1  F64    : tas
         """
-        parser = SinfoParser()
-        result = parser.parse(output)
+        result = sinfo_parser.parse(output)
 
         assert len(result["variables"]) == 1
         var = result["variables"][0]
@@ -202,28 +319,9 @@ File format: NetCDF
         assert var["gridsize"] == 10000
         assert var["dtype"] == "F64"
 
-    def test_parse_complete_sinfo_output(self):
+    def test_parse_complete_sinfo_output(self, sinfo_parser):
         """Test parsing complete sinfo output with all sections."""
-        output = """File format : NetCDF4
-    -1 : Institut Source   T Steptype Levels Num    Points Num Dtype : Parameter ID
-     1 : unknown  unknown  v instant       1   1     17415   1  F32  : 260
-   Grid coordinates :
-     1 : lonlat                   : points=17415 (135x129)
-                              lon : 66.5 to 100 by 0.25 [degrees_east]
-                              lat : 6.5 to 38.5 by 0.25 [degrees_north]
-   Vertical coordinates :
-     1 : surface                  : levels=1
-   Time coordinate :
-                             time : 43464 steps
-     RefTime =  1901-01-01 00:00:00  Units = hours  Calendar = standard
-  YYYY-MM-DD hh:mm:ss  YYYY-MM-DD hh:mm:ss  YYYY-MM-DD hh:mm:ss  YYYY-MM-DD hh:mm:ss
-  1901-01-01 00:00:00  1901-01-02 00:00:00  1901-01-03 00:00:00  1901-01-04 00:00:00
-  1901-01-05 00:00:00  1901-01-06 00:00:00  1901-01-07 00:00:00  1901-01-08 00:00:00
-  ................................................................................
-  2019-12-28 00:00:00  2019-12-29 00:00:00  2019-12-30 00:00:00  2019-12-31 00:00:00
-        """
-        parser = SinfoParser()
-        result = parser.parse(output)
+        result = sinfo_parser.parse(SAMPLE_SINFO_COMPLETE_OUTPUT)
 
         # Test metadata
         assert result["metadata"]["format"] == "NetCDF4"
@@ -272,7 +370,28 @@ File format: NetCDF
         assert result["time"]["time_resolution"]["regular"] is True
         assert result["time"]["time_resolution"]["interval"] == "1 day"
 
-    def test_parse_grid_coordinates_only(self):
+    def test_parse_timesteps_are_strings(self, sinfo_parser):
+        """Test that timesteps stay a JSON-serialisable list of strings."""
+        result = sinfo_parser.parse(SAMPLE_SINFO_COMPLETE_OUTPUT)
+
+        steps = result["time"]["timesteps"]
+        assert isinstance(steps, list)
+        assert len(steps) == 12
+        assert steps[0] == "1901-01-01 00:00:00"
+        assert steps[-1] == "2019-12-31 00:00:00"
+        json.dumps(result)
+
+    def test_parse_timesteps_non_gregorian(self, sinfo_parser):
+        """Test that dates NumPy cannot represent are kept as-is."""
+        output = SAMPLE_SINFO_COMPLETE_OUTPUT.replace(
+            "2019-12-28 00:00:00", "2019-02-30 00:00:00"
+        )
+        result = sinfo_parser.parse(output)
+
+        assert result["time"]["timesteps"][-4] == "2019-02-30 00:00:00"
+        assert result["time"]["time_resolution"]["interval"] == "1 day"
+
+    def test_parse_grid_coordinates_only(self, sinfo_parser):
         """Test parsing just grid coordinates section."""
         output = """
    Grid coordinates :
@@ -280,8 +399,7 @@ File format: NetCDF
                               lon : -179.5 to 179.5 by 1.0 [degrees_east]
                               lat : -89.5 to 89.5 by 1.0 [degrees_north]
         """
-        parser = SinfoParser()
-        result = parser.parse(output)
+        result = sinfo_parser.parse(output)
 
         assert result["grid"]["id"] == 1
         assert result["grid"]["type"] == "lonlat"
@@ -291,7 +409,7 @@ File format: NetCDF
         assert result["grid"]["lon_resolution"] == 1.0
         assert result["grid"]["lat_resolution"] == 1.0
 
-    def test_parse_time_coordinates_with_resolution(self):
+    def test_parse_time_coordinates_with_resolution(self, sinfo_parser):
         """Test parsing time coordinates and calculating resolution."""
         output = """
    Time coordinate :
@@ -301,8 +419,7 @@ File format: NetCDF
   2020-01-01 00:00:00  2020-01-02 00:00:00  2020-01-03 00:00:00  2020-01-04 00:00:00
   2020-01-05 00:00:00  2020-01-06 00:00:00  2020-01-07 00:00:00  2020-01-08 00:00:00
         """
-        parser = SinfoParser()
-        result = parser.parse(output)
+        result = sinfo_parser.parse(output)
 
         assert result["time"]["steps"] == 365
         assert result["time"]["reftime"] == "2020-01-01 00:00:00"
@@ -313,75 +430,62 @@ File format: NetCDF
         assert result["time"]["time_resolution"]["regular"] is True
         assert result["time"]["time_resolution"]["interval"] == "1 day"
 
-    def test_parse_time_coordinates_hourly(self):
-        """Test parsing hourly time resolution."""
-        output = """
-   Time coordinate :
-                             time : 24 steps
-     RefTime =  2020-01-01 00:00:00  Units = hours  Calendar = standard
-  YYYY-MM-DD hh:mm:ss  YYYY-MM-DD hh:mm:ss  YYYY-MM-DD hh:mm:ss  YYYY-MM-DD hh:mm:ss
-  2020-01-01 00:00:00  2020-01-01 01:00:00  2020-01-01 02:00:00  2020-01-01 03:00:00
-  2020-01-01 04:00:00  2020-01-01 05:00:00  2020-01-01 06:00:00  2020-01-01 07:00:00
-        """
-        parser = SinfoParser()
-        result = parser.parse(output)
-
-        assert result["time"]["steps"] == 24
-        assert result["time"]["time_resolution"]["regular"] is True
-        assert result["time"]["time_resolution"]["interval"] == "1 hour"
-        assert result["time"]["time_resolution"]["interval_seconds"] == 3600
-
-    def test_parse_time_coordinates_6hourly(self):
-        """Test parsing 6-hourly time resolution."""
-        output = """
+    @pytest.mark.parametrize(
+        "timesteps,interval,seconds",
+        [
+            (
+                "2020-01-01 00:00:00  2020-01-01 01:00:00  "
+                "2020-01-01 02:00:00  2020-01-01 03:00:00",
+                "1 hour",
+                3600,
+            ),
+            (
+                "2020-01-01 00:00:00  2020-01-01 06:00:00  "
+                "2020-01-01 12:00:00  2020-01-01 18:00:00",
+                "6 hours",
+                21600,
+            ),
+        ],
+    )
+    def test_parse_time_coordinates_subdaily(
+        self, sinfo_parser, timesteps, interval, seconds
+    ):
+        """Test parsing hourly and 6-hourly time resolution."""
+        output = f"""
    Time coordinate :
                              time : 4 steps
      RefTime =  2020-01-01 00:00:00  Units = hours  Calendar = standard
   YYYY-MM-DD hh:mm:ss  YYYY-MM-DD hh:mm:ss  YYYY-MM-DD hh:mm:ss  YYYY-MM-DD hh:mm:ss
-  2020-01-01 00:00:00  2020-01-01 06:00:00  2020-01-01 12:00:00  2020-01-01 18:00:00
+  {timesteps}
         """
-        parser = SinfoParser()
-        result = parser.parse(output)
+        result = sinfo_parser.parse(output)
 
+        assert result["time"]["steps"] == 4
         assert result["time"]["time_resolution"]["regular"] is True
-        assert result["time"]["time_resolution"]["interval"] == "6 hours"
-        assert result["time"]["time_resolution"]["interval_seconds"] == 21600
-
-    def test_parse_vertical_coordinates_surface(self):
-        """Test parsing surface vertical coordinates."""
-        output = """
-   Vertical coordinates :
-     1 : surface                  : levels=1
-        """
-        parser = SinfoParser()
-        result = parser.parse(output)
+        assert result["time"]["time_resolution"]["interval"] == interval
+        assert result["time"]["time_resolution"]["interval_seconds"] == seconds
 
-        assert result["vertical"]["id"] == 1
-        assert result["vertical"]["type"] == "surface"
-        assert result["vertical"]["levels"] == 1
-
-    def test_parse_vertical_coordinates_pressure(self):
-        """Test parsing pressure level vertical coordinates."""
-        output = """
+    @pytest.mark.parametrize("zaxistype,levels", [("surface", 1), ("pressure", 4)])
+    def test_parse_vertical_coordinates(self, sinfo_parser, zaxistype, levels):
+        """Test parsing surface and pressure level vertical coordinates."""
+        output = f"""
    Vertical coordinates :
-     1 : pressure                 : levels=4
+     1 : {zaxistype:<24} : levels={levels}
         """
-        parser = SinfoParser()
-        result = parser.parse(output)
+        result = sinfo_parser.parse(output)
 
         assert result["vertical"]["id"] == 1
-        assert result["vertical"]["type"] == "pressure"
-        assert result["vertical"]["levels"] == 4
+        assert result["vertical"]["type"] == zaxistype
+        assert result["vertical"]["levels"] == levels
 
-    def test_parse_new_format_variable_line(self):
+    def test_parse_new_format_variable_line(self, sinfo_parser):
         """Test parsing new format variable line with institut/source fields."""
         output = """
 File format : NetCDF4
     -1 : Institut Source   T Steptype Levels Num    Points Num Dtype : Parameter ID
      1 : ECMWF    ERA5    v instant       1   1     259920   1  F64  : tas
         """
-        parser = SinfoParser()
-        result = parser.parse(output)
+        result = sinfo_parser.parse(output)
 
         assert len(result["variables"]) == 1
         var = result["variables"][0]
@@ -394,14 +498,13 @@ File format : NetCDF4
         assert var["points"] == 259920
         assert var["dtype"] == "F64"
 
-    def test_empty_sections(self):
+    def test_empty_sections(self, sinfo_parser):
         """Test that empty sections are handled gracefully."""
         output = """
 File format : NetCDF
    -1 : Institut Source   T Steptype Levels Num    Points Num Dtype : Parameter ID
         """
-        parser = SinfoParser()
-        result = parser.parse(output)
+        result = sinfo_parser.parse(output)
 
         assert result["metadata"]["format"] == "NetCDF"
         assert len(result["variables"]) == 0
@@ -413,15 +516,14 @@ File format : NetCDF
 class TestVlistParser:
     """Tests for VlistParser."""
 
-    def test_parse_variable_list(self):
+    def test_parse_variable_list(self, vlist_parser):
         """Test parsing variable list."""
         output = """
 temperature 500 hPa
 precipitation surface
 wind_speed 10m
         """
-        parser = VlistParser()
-        result = parser.parse(output)
+        result = vlist_parser.parse(output)
 
         assert isinstance(result, list)
         assert len(result) == 3
@@ -430,14 +532,13 @@ wind_speed 10m
 class TestPartabParser:
     """Tests for PartabParser."""
 
-    def test_parse_parameter_table(self):
+    def test_parse_parameter_table(self, partab_parser):
         """Test parsing parameter table."""
         output = """
 1 | temperature | K | Air temperature
 2 | pressure | Pa | Air pressure
         """
-        parser = PartabParser()
-        result = parser.parse(output)
+        result = partab_parser.parse(output)
 
         assert isinstance(result, list)
         assert len(result) == 2
@@ -445,14 +546,13 @@ class TestPartabParser:
         assert result[0]["name"] == "temperature"
         assert result[0]["units"] == "K"
 
-    def test_parse_space_separated(self):
+    def test_parse_space_separated(self, partab_parser):
         """Test parsing space-separated format."""
         output = """
 101 temp K
 102 pres Pa
         """
-        parser = PartabParser()
-        result = parser.parse(output)
+        result = partab_parser.parse(output)
 
         assert isinstance(result, list)
         assert len(result) == 2
@@ -461,28 +561,35 @@ class TestPartabParser:
 class TestVctParser:
     """Tests for VctParser."""
 
-    def test_parse_vct_values(self):
+    def test_parse_vct_values(self, vct_parser):
         """Test parsing VCT values."""
         output = """
 0.0 0.1 0.2 0.5
 1.0 2.0 3.0 5.0
         """
-        parser = VctParser()
-        result = parser.parse(output)
+        result = vct_parser.parse(output)
 
         assert "vct" in result
         assert len(result["vct"]) == 8
         assert result["vct"][0] == 0.0
         assert result["vct"][-1] == 5.0
 
-    def test_parse_single_line_vct(self):
+    def test_parse_single_line_vct(self, vct_parser):
         """Test parsing VCT on single line."""
         output = "0.0 1.0 2.0 3.0"
-        parser = VctParser()
-        result = parser.parse(output)
+        result = vct_parser.parse(output)
 
         assert len(result["vct"]) == 4
 
+    def test_parse_single_line_skips_line_filter(self, vct_parser, monkeypatch):
+        """Test that newline-terminated one-line output takes the fast path."""
+        monkeypatch.setattr(vct_parser, "parse_lines", None)
+        assert vct_parser.parse("0.0 0.5 1.0\n") == {"vct": [0.0, 0.5, 1.0]}
+
+    def test_parse_single_comment_line(self, vct_parser):
+        """Test that a lone comment line yields no values."""
+        assert vct_parser.parse("# 1.0 2.0") == {"vct": []}
+
 
 class TestParseCdoOutput:
     """Tests for parse_cdo_output function."""
@@ -509,13 +616,111 @@ gridtype = lonlat
 
     def test_parse_unsupported_command(self):
         """Test parsing unsupported command raises error."""
-        with pytest.raises(ValueError, match="No parser available"):
+        with pytest.raises(ValueError) as exc:
             parse_cdo_output("unsupported_cmd data.nc", "some output")
+        assert "No parser available" in str(exc.value)
 
     def test_parse_empty_command(self):
         """Test parsing empty command raises error."""
-        with pytest.raises(ValueError, match="Empty command"):
+        with pytest.raises(ValueError) as exc:
             parse_cdo_output("", "some output")
+        assert "Empty command" in str(exc.value)
+
+    def test_parse_file_matches_string(self, tmp_path):
+        """Test that parsing a captured output file matches parsing the text."""
+        path = tmp_path / "sinfo.txt"
+        path.write_bytes(SAMPLE_SINFO_COMPLETE_OUTPUT.replace("\n", "\r\n").encode())
+
+        result = parse_cdo_output_file("sinfo data.nc", path)
+        expected = parse_cdo_output("sinfo data.nc", SAMPLE_SINFO_COMPLETE_OUTPUT)
+        assert result["variables"] == expected["variables"]
+        assert result["grid"] == expected["grid"]
+        assert result["time"]["last_timestep"] == "2019-12-31 00:00:00"
+
+    def test_parse_file_empty(self, tmp_path):
+        """Test that an empty output file parses to the empty result."""
+        path = tmp_path / "griddes.txt"
+        path.touch()
+
+        assert parse_cdo_output_file("griddes", path) == {}
+
+    def test_parse_file_encoding(self, tmp_path):
+        """Test that undecodable bytes are replaced and encoding is honoured."""
+        path = tmp_path / "showatts.txt"
+        path.write_bytes(
+            'tas attributes:\n  long_name = "Temp \u00e0 2m"\n'.encode("latin-1")
+        )
+
+        replaced = parse_cdo_output_file("showatts", path)
+        assert replaced["tas"]["long_name"] == "Temp \ufffd 2m"
+
+        decoded = parse_cdo_output_file("showatts", path, encoding="latin-1")
+        assert decoded["tas"]["long_name"] == "Temp \u00e0 2m"
+
+    def test_parse_file_unsupported_command(self, tmp_path):
+        """Test that an unsupported command raises before opening the file."""
+        with pytest.raises(ValueError) as exc:
+            parse_cdo_output_file("unsupported_cmd", tmp_path / "missing.txt")
+        assert "No parser available" in str(exc.value)
+
+    def test_parse_registered_after_import(self, monkeypatch):
+        """Test that commands added to PARSER_REGISTRY at runtime dispatch."""
+        monkeypatch.setitem(PARSER_REGISTRY, "mycmd", VctParser)
+
+        result = parse_cdo_output("mycmd data.nc", "1.0 2.0")
+        assert result == {"vct": [1.0, 2.0]}
+
+    def test_parse_with_cache_reuses_result(self):
+        """Test that cache=True returns the earlier result for same output."""
+        output = "gridtype = lonlat\ngridsize = 42"
+        first = parse_cdo_output("griddes a.nc", output, cache=True)
+        second = parse_cdo_output("griddes b.nc", output, cache=True)
+        assert first is second
+        assert first["gridsize"] == 42
+
+    def test_parse_with_cache_concurrent(self):
+        """Test that concurrent cached parsing with evictions does not fail."""
+        outputs = [f"gridtype = lonlat\ngridsize = {i}" for i in range(300)]
+
+        def parse(output):
+            return parse_cdo_output("griddes", output, cache=True)["gridsize"]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            sizes = list(pool.map(parse, outputs * 4))
+        assert sizes == list(range(300)) * 4
+
+    def test_parse_without_cache_returns_fresh_result(self):
+        """Test that results are not shared by default."""
+        output = "gridtype = lonlat\ngridsize = 43"
+        first = parse_cdo_output("griddes data.nc", output)
+        second = parse_cdo_output("griddes data.nc", output)
+        assert first == second
+        assert first is not second
+
+    @pytest.mark.parametrize(
+        "command,expected",
+        [
+            ("griddes", {}),
+            ("vlist", []),
+            ("vct", {"vct": []}),
+            (
+                "sinfo",
+                {
+                    "variables": [],
+                    "metadata": {},
+                    "grid": {},
+                    "vertical": {},
+                    "time": {},
+                },
+            ),
+        ],
+    )
+    def test_parse_blank_output(self, command, expected):
+        """Test that blank output yields a fresh empty result, even when cached."""
+        first = parse_cdo_output(f"{command} data.nc", "  \n ", cache=True)
+        second = parse_cdo_output(f"{command} data.nc", "", cache=True)
+        assert first == second == expected
+        assert first is not second
 
 
 class TestGetSupportedStructuredCommands:
@@ -523,58 +728,66 @@ class TestGetSupportedStructuredCommands:
 
     def test_returns_frozenset(self):
         """Test that function returns a frozenset."""
-        commands = get_supported_structured_commands()
-        assert isinstance(commands, frozenset)
+        assert isinstance(_SUPPORTED, frozenset)
 
     def test_contains_expected_commands(self):
         """Test that expected commands are included."""
-        commands = get_supported_structured_commands()
         expected = {"griddes", "sinfo", "showatts", "zaxisdes", "vct"}
-        assert expected.issubset(commands)
+        assert expected.issubset(_SUPPORTED)
 
     def test_immutable(self):
         """Test that returned set is immutable."""
-        commands = get_supported_structured_commands()
-        with pytest.raises(AttributeError):
-            commands.add("new_command")  # type: ignore
+        assert not hasattr(_SUPPORTED, "add")
+        assert not hasattr(_SUPPORTED, "remove")
+
+    def test_includes_commands_registered_later(self, monkeypatch):
+        """Test that the set follows commands added to PARSER_REGISTRY."""
+        monkeypatch.setitem(PARSER_REGISTRY, "mycmd", VctParser)
+        assert "mycmd" in get_supported_structured_commands()
 
 
 class TestGriddesParserEdgeCases:
     """Edge case tests for GriddesParser helper methods."""
 
-    def test_is_float_with_integer_string(self):
-        """Test _is_float with integer string."""
-        assert GriddesParser._is_float("42") is True
-
-    def test_is_float_with_negative(self):
-        """Test _is_float with negative number."""
-        assert GriddesParser._is_float("-3.14") is True
-
-    def test_is_float_with_scientific_notation(self):
-        """Test _is_float with scientific notation."""
-        assert GriddesParser._is_float("1.5e-10") is True
-
-    def test_is_float_with_invalid_string(self):
-        """Test _is_float with non-numeric string."""
-        assert GriddesParser._is_float("not_a_number") is False
-        assert GriddesParser._is_float("") is False
-
-    def test_parse_array_with_mixed_values(self):
-        """Test _parse_array with mixed valid and invalid values."""
-        result = GriddesParser._parse_array("1.0 invalid 2.5 3.0")
-        assert result == [1.0, 2.5, 3.0]
-
-    def test_parse_array_empty_string(self):
-        """Test _parse_array with empty string."""
-        result = GriddesParser._parse_array("")
-        assert result == []
-
-    def test_parse_array_all_invalid(self):
-        """Test _parse_array with all invalid values."""
-        result = GriddesParser._parse_array("not valid at all")
-        assert result == []
-
-    def test_parse_empty_lines_and_whitespace(self):
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            ("42", 42),
+            ("-1", -1),
+            ("-3.14", -3.14),
+            ("1.5e-10", 1.5e-10),
+            ("-0.0", -0.0),
+            ("inf", float("inf")),
+            ("not_a_number", "not_a_number"),
+            ("", ""),
+        ],
+    )
+    def test_coerce(self, value, expected):
+        """Test _coerce on integer, negative, scientific and invalid strings."""
+        result = _coerce(value)
+        assert result == expected
+        assert type(result) is type(expected)
+
+    def test_coerce_nan(self):
+        """Test that "nan" is converted to a float, not kept as a string."""
+        result = _coerce("nan")
+        assert isinstance(result, float)
+        assert math.isnan(result)
+
+    @pytest.mark.parametrize(
+        "values,expected",
+        [
+            ("1.0 invalid 2.5 3.0", [1.0, 2.5, 3.0]),
+            ("", []),
+            ("  \n ", []),
+            ("not valid at all", []),
+        ],
+    )
+    def test_parse_array(self, values, expected):
+        """Test _parse_array with mixed, empty, blank and all-invalid input."""
+        assert GriddesParser._parse_array(values) == expected
+
+    def test_parse_empty_lines_and_whitespace(self, griddes_parser):
         """Test parsing with empty lines and extra whitespace."""
         output = """
 
@@ -583,8 +796,7 @@ gridtype = lonlat
 gridsize = 100
 
         """
-        parser = GriddesParser()
-        result = parser.parse(output)
+        result = griddes_parser.parse(output)
         assert result["gridtype"] == "lonlat"
         assert result["gridsize"] == 100
 
@@ -592,29 +804,27 @@ gridsize = 100
 class TestZaxisdesParserEdgeCases:
     """Edge case tests for ZaxisdesParser."""
 
-    def test_parse_with_lbounds(self):
+    def test_parse_with_lbounds(self, zaxisdes_parser):
         """Test parsing with lbounds array."""
         output = """
 zaxistype = hybrid
 lbounds = 0.0 100.0 500.0 1000.0
         """
-        parser = ZaxisdesParser()
-        result = parser.parse(output)
+        result = zaxisdes_parser.parse(output)
         assert "lbounds" in result
         assert len(result["lbounds"]) == 4
 
-    def test_parse_with_ubounds(self):
+    def test_parse_with_ubounds(self, zaxisdes_parser):
         """Test parsing with ubounds array."""
         output = """
 zaxistype = hybrid
 ubounds = 100.0 500.0 1000.0 1500.0
         """
-        parser = ZaxisdesParser()
-        result = parser.parse(output)
+        result = zaxisdes_parser.parse(output)
         assert "ubounds" in result
         assert len(result["ubounds"]) == 4
 
-    def test_parse_with_all_arrays(self):
+    def test_parse_with_all_arrays(self, zaxisdes_parser):
         """Test parsing with levels, vct, lbounds, and ubounds."""
         output = """
 zaxistype = hybrid
@@ -624,33 +834,42 @@ vct = 0.0 0.5 1.0
 lbounds = 0.5 1.5
 ubounds = 1.5 2.5
         """
-        parser = ZaxisdesParser()
-        result = parser.parse(output)
+        result = zaxisdes_parser.parse(output)
         assert result["size"] == 2
         assert len(result["levels"]) == 2
         assert len(result["vct"]) == 3
         assert len(result["lbounds"]) == 2
         assert len(result["ubounds"]) == 2
 
-    def test_is_float_edge_cases(self):
-        """Test _is_float with edge cases."""
-        assert ZaxisdesParser._is_float("0.0") is True
-        assert ZaxisdesParser._is_float("-0.0") is True
-        assert ZaxisdesParser._is_float("inf") is True
-        assert ZaxisdesParser._is_float("nan") is True
-        assert ZaxisdesParser._is_float("") is False
-        assert ZaxisdesParser._is_float("abc") is False
+    def test_parse_negative_integer(self, zaxisdes_parser):
+        """Test that negative integers are kept as int, not float."""
+        output = """
+zaxistype = generic
+size = 1
+positive = -1
+scale = 0.5
+        """
+        result = zaxisdes_parser.parse(output)
+        assert result["positive"] == -1
+        assert isinstance(result["positive"], int)
+        assert result["scale"] == 0.5
+
+    def test_parse_non_finite_values(self, zaxisdes_parser):
+        """Test that nan/inf scalar values come back as floats."""
+        result = zaxisdes_parser.parse("missval = nan\nscale = -inf\nname = abc")
+        assert math.isnan(result["missval"])
+        assert result["scale"] == float("-inf")
+        assert result["name"] == "abc"
 
     def test_parse_array_with_invalid_values(self):
         """Test _parse_array skips invalid values."""
         result = ZaxisdesParser._parse_array("1.0 bad 2.0 invalid 3.0")
         assert result == [1.0, 2.0, 3.0]
 
-    def test_parse_empty_output(self):
+    def test_parse_empty_output(self, zaxisdes_parser):
         """Test parsing empty zaxisdes output."""
         output = ""
-        parser = ZaxisdesParser()
-        result = parser.parse(output)
+        result = zaxisdes_parser.parse(output)
         assert isinstance(result, dict)
         assert len(result) == 0
 
@@ -658,6 +877,24 @@ ubounds = 1.5 2.5
 class TestSinfoParserEdgeCases:
     """Edge case tests for SinfoParser."""
 
+    def test_parse_consecutive_tables(self, sinfo_parser):
+        """Test that the line ending a variable table is dispatched normally."""
+        output = """
+File format: NetCDF
+   -1 : Date     Time   Level Gridsize    Num    Dtype : Parameter name
+    1 : 2020-01-01 00:00:00       0   518400      1  F64    : tas
+File format : GRIB
+    -1 : Institut Source   T Steptype Levels Num    Points Num Dtype : Parameter ID
+     1 : unknown  unknown  v instant       1   1     17415   1  F32  : 260
+        """
+        result = sinfo_parser.parse(output)
+
+        assert result["metadata"]["format"] == "GRIB"
+        assert "Institut" in result["metadata"]["variable_fields"]
+        assert [v["name"] for v in result["variables"]] == ["tas", "260"]
+        assert result["variables"][1]["institut"] == "unknown"
+        assert result["variables"][1]["points"] == 17415
+
     def test_parse_variable_line_insufficient_fields(self):
         """Test _parse_variable_line with insufficient fields."""
         # Line with too few fields
@@ -666,6 +903,30 @@ class TestSinfoParserEdgeCases:
         assert result is not None
         assert result["name"] == "varname"
 
+    @pytest.mark.parametrize(
+        "level,expected",
+        [("0", 0), ("+3", 3), ("-1", -1), ("surface", "surface"), ("1.5", "1.5")],
+    )
+    def test_parse_variable_line_level_values(self, level, expected):
+        """Test that integer columns convert signed counts and keep other text."""
+        line = f"1 : 2020-01-01 00:00:00 {level} 10000 1 F64 : tas"
+        result = SinfoParser._parse_variable_line(line)
+        assert result is not None
+        assert result["level"] == expected
+
+    def test_parse_uses_header_layout(self, sinfo_parser):
+        """Test that the table header, not the field count, picks the layout."""
+        output = """
+   -1 : Date     Time   Level Gridsize    Num    Dtype : Parameter name
+    1 : 2020-01-01 00:00:00  0  518400  1  F64  x  y  z : tas
+        """
+        result = sinfo_parser.parse(output)
+
+        var = result["variables"][0]
+        assert var["date"] == "2020-01-01"
+        assert var["dtype"] == "F64"
+        assert "institut" not in var
+
     def test_parse_variable_line_no_colons(self):
         """Test _parse_variable_line with no colons."""
         result = SinfoParser._parse_variable_line("no colons here")
@@ -869,7 +1130,7 @@ class TestSinfoParserEdgeCases:
 class TestVlistParserEdgeCases:
     """Edge case tests for VlistParser."""
 
-    def test_parse_with_comments(self):
+    def test_parse_with_comments(self, vlist_parser):
         """Test parsing with comment lines."""
         output = """
 # This is a comment
@@ -877,14 +1138,12 @@ variable1 info
 # Another comment
 variable2 info
         """
-        parser = VlistParser()
-        result = parser.parse(output)
+        result = vlist_parser.parse(output)
         assert len(result) == 2
 
-    def test_parse_empty_output(self):
+    def test_parse_empty_output(self, vlist_parser):
         """Test parsing empty output."""
-        parser = VlistParser()
-        result = parser.parse("")
+        result = vlist_parser.parse("")
         assert isinstance(result, list)
         assert len(result) == 0
 
@@ -909,7 +1168,7 @@ variable2 info
 class TestShowattsParserEdgeCases:
     """Edge case tests for ShowattsParser."""
 
-    def test_parse_with_quoted_values(self):
+    def test_parse_with_quoted_values(self, showatts_parser):
         """Test parsing attributes with quoted values."""
         output = """
 temperature attributes:
@@ -917,14 +1176,24 @@ long_name = "Air Temperature"
 units = "K"
 description = 'Temperature in Kelvin'
         """
-        parser = ShowattsParser()
-        result = parser.parse(output)
+        result = showatts_parser.parse(output)
         assert "temperature" in result
         assert result["temperature"]["long_name"] == "Air Temperature"
         assert result["temperature"]["units"] == "K"
         assert result["temperature"]["description"] == "Temperature in Kelvin"
 
-    def test_parse_multiple_variables(self):
+    def test_parse_unbalanced_quotes_are_kept(self, showatts_parser):
+        """Test that only a matching pair of quotes is removed."""
+        output = """
+temperature attributes:
+comment = "unterminated
+title = 'mixed"
+        """
+        result = showatts_parser.parse(output)
+        assert result["temperature"]["comment"] == '"unterminated'
+        assert result["temperature"]["title"] == "'mixed\""
+
+    def test_parse_multiple_variables(self, showatts_parser):
         """Test parsing attributes for multiple variables."""
         output = """
 temperature attributes:
@@ -935,14 +1204,13 @@ pressure attributes:
 units = Pa
 long_name = Pressure
         """
-        parser = ShowattsParser()
-        result = parser.parse(output)
+        result = showatts_parser.parse(output)
         assert "temperature" in result
         assert "pressure" in result
         assert result["temperature"]["units"] == "K"
         assert result["pressure"]["units"] == "Pa"
 
-    def test_parse_with_empty_lines(self):
+    def test_parse_with_empty_lines(self, showatts_parser):
         """Test parsing with empty lines."""
         output = """
 temperature attributes:
@@ -951,12 +1219,11 @@ units = K
 long_name = Temperature
 
         """
-        parser = ShowattsParser()
-        result = parser.parse(output)
+        result = showatts_parser.parse(output)
         assert result["temperature"]["units"] == "K"
         assert result["temperature"]["long_name"] == "Temperature"
 
-    def test_parse_attribute_without_equals(self):
+    def test_parse_attribute_without_equals(self, showatts_parser):
         """Test parsing line without equals sign (should skip)."""
         output = """
 temperature attributes:
@@ -964,13 +1231,12 @@ units = K
 invalid line without equals
 long_name = Temperature
         """
-        parser = ShowattsParser()
-        result = parser.parse(output)
+        result = showatts_parser.parse(output)
         # Should skip invalid line
         assert "units" in result["temperature"]
         assert "long_name" in result["temperature"]
 
-    def test_parse_malformed_section_header(self):
+    def test_parse_malformed_section_header(self, showatts_parser):
         """Test parsing with various section header formats."""
         output = """
 Temperature Attributes:
@@ -979,15 +1245,13 @@ units = K
 Pressure:
 units = Pa
         """
-        parser = ShowattsParser()
-        result = parser.parse(output)
+        result = showatts_parser.parse(output)
         # Should handle case variations
         assert len(result) >= 1
 
-    def test_parse_empty_output(self):
+    def test_parse_empty_output(self, showatts_parser):
         """Test parsing empty output."""
-        parser = ShowattsParser()
-        result = parser.parse("")
+        result = showatts_parser.parse("")
         assert isinstance(result, dict)
         assert len(result) == 0
 
@@ -995,7 +1259,7 @@ units = Pa
 class TestPartabParserEdgeCases:
     """Edge case tests for PartabParser."""
 
-    def test_parse_with_comments(self):
+    def test_parse_with_comments(self, partab_parser):
         """Test parsing with comment lines."""
         output = """
 # Parameter table
@@ -1003,8 +1267,7 @@ class TestPartabParserEdgeCases:
 # More comments
 2 | pres | Pa | Pressure
         """
-        parser = PartabParser()
-        result = parser.parse(output)
+        result = partab_parser.parse(output)
         assert len(result) == 2
 
     def test_parse_parameter_line_single_part(self):
@@ -1036,26 +1299,54 @@ class TestPartabParserEdgeCases:
         )
         assert result["description"] == "Air temperature at 2m"
 
+    def test_parse_separator_ignores_comments(self, partab_parser):
+        """Test that comments do not pick the separator for the table."""
+        output = "# code | name\n1 temp K\n2 pres Pa"
+        result = partab_parser.parse(output)
+        assert [p["name"] for p in result] == ["temp", "pres"]
+
+    def test_parse_whitespace_row_inside_pipe_table(self, partab_parser):
+        """Test that a row without pipes in a pipe table is split on spaces."""
+        output = "1 | temp | K\n3 hum %\n2 | pres | Pa"
+        result = partab_parser.parse(output)
+        assert [p["code"] for p in result] == ["1", "3", "2"]
+        assert result[1]["name"] == "hum"
+        assert result[1]["units"] == "%"
+
+    def test_parse_pipe_row_after_space_separated_rows(self, partab_parser):
+        """Test that a late pipe row in a space table is split on pipes."""
+        rows = [f"{code} var{code} K" for code in range(1, 7)]
+        output = "\n".join([*rows, "7 | air temp | K | Air temperature"])
+        result = partab_parser.parse(output)
+        assert len(result) == 7
+        assert result[-1]["name"] == "air temp"
+        assert result[-1]["description"] == "Air temperature"
+
+    def test_parse_parameter_line_explicit_separator(self):
+        """Test _parse_parameter_line with a pre-detected separator."""
+        result = PartabParser._parse_parameter_line("1 temp K", False)
+        assert result["code"] == "1"
+        assert result["name"] == "temp"
+        assert result["units"] == "K"
+
     def test_parse_parameter_line_empty(self):
         """Test _parse_parameter_line with empty string."""
         result = PartabParser._parse_parameter_line("")
         assert result is None
 
-    def test_parse_space_separated_no_pipes(self):
+    def test_parse_space_separated_no_pipes(self, partab_parser):
         """Test space-separated format without pipes."""
         output = """
 101 temperature K
 102 pressure Pa
         """
-        parser = PartabParser()
-        result = parser.parse(output)
+        result = partab_parser.parse(output)
         assert len(result) == 2
         assert result[0]["code"] == "101"
 
-    def test_parse_empty_output(self):
+    def test_parse_empty_output(self, partab_parser):
         """Test parsing empty output."""
-        parser = PartabParser()
-        result = parser.parse("")
+        result = partab_parser.parse("")
         assert isinstance(result, list)
         assert len(result) == 0
 
@@ -1063,7 +1354,7 @@ class TestPartabParserEdgeCases:
 class TestVctParserEdgeCases:
     """Edge case tests for VctParser."""
 
-    def test_parse_with_comments(self):
+    def test_parse_with_comments(self, vct_parser):
         """Test parsing with comment lines."""
         output = """
 # VCT values
@@ -1071,42 +1362,37 @@ class TestVctParserEdgeCases:
 # More data
 3.0 4.0 5.0
         """
-        parser = VctParser()
-        result = parser.parse(output)
+        result = vct_parser.parse(output)
         assert len(result["vct"]) == 6
 
-    def test_parse_with_invalid_values(self):
+    def test_parse_with_invalid_values(self, vct_parser):
         """Test parsing with some invalid values."""
         output = """
 0.0 invalid 1.0 bad 2.0
         """
-        parser = VctParser()
-        result = parser.parse(output)
+        result = vct_parser.parse(output)
         # Should skip invalid values
         assert len(result["vct"]) == 3
         assert result["vct"] == [0.0, 1.0, 2.0]
 
-    def test_parse_empty_output(self):
+    def test_parse_empty_output(self, vct_parser):
         """Test parsing empty output."""
-        parser = VctParser()
-        result = parser.parse("")
+        result = vct_parser.parse("")
         assert isinstance(result, dict)
         assert "vct" in result
         assert len(result["vct"]) == 0
 
-    def test_parse_negative_values(self):
+    def test_parse_negative_values(self, vct_parser):
         """Test parsing negative VCT values."""
         output = "-1.0 -0.5 0.0 0.5 1.0"
-        parser = VctParser()
-        result = parser.parse(output)
+        result = vct_parser.parse(output)
         assert result["vct"][0] == -1.0
         assert result["vct"][-1] == 1.0
 
-    def test_parse_scientific_notation(self):
+    def test_parse_scientific_notation(self, vct_parser):
         """Test parsing values in scientific notation."""
         output = "1.0e-5 1.5e-3 2.0e-1"
-        parser = VctParser()
-        result = parser.parse(output)
+        result = vct_parser.parse(output)
         assert len(result["vct"]) == 3
         assert result["vct"][0] < 1e-4
 
@@ -1114,52 +1400,26 @@ class TestVctParserEdgeCases:
 class TestParseCdoOutputEdgeCases:
     """Edge case tests for parse_cdo_output function."""
 
-    def test_parse_command_with_parameters(self):
-        """Test parsing command with parameters like selname,var1,var2."""
-        output = "gridtype = lonlat"
-        result = parse_cdo_output("griddes,123 data.nc", output)
-        # Should extract 'griddes' operator
-        assert isinstance(result, dict)
-
-    def test_parse_command_with_dash_prefix(self):
-        """Test parsing command with dash prefix."""
-        output = "gridtype = lonlat"
-        result = parse_cdo_output("-griddes data.nc", output)
-        assert isinstance(result, dict)
-
-    def test_parse_command_case_insensitive(self):
-        """Test that command parsing is case insensitive."""
-        output = "gridtype = lonlat"
-        result = parse_cdo_output("GRIDDES data.nc", output)
-        assert isinstance(result, dict)
-
-    def test_parse_command_sinfo_variant(self):
-        """Test parsing sinfo variants (sinfo, sinfon, sinfov)."""
-        output = "File format: NetCDF"
-        result1 = parse_cdo_output("sinfo data.nc", output)
-        result2 = parse_cdo_output("sinfon data.nc", output)
-        result3 = parse_cdo_output("sinfov data.nc", output)
-        assert isinstance(result1, dict)
-        assert isinstance(result2, dict)
-        assert isinstance(result3, dict)
-
-    def test_parse_command_info_variant(self):
-        """Test parsing info variants (info, infon, infov)."""
-        output = "File format: NetCDF"
-        result = parse_cdo_output("infon data.nc", output)
-        assert isinstance(result, dict)
-
-    def test_parse_command_griddes2(self):
-        """Test parsing griddes2 command."""
-        output = "gridtype = lonlat"
-        result = parse_cdo_output("griddes2 data.nc", output)
-        assert isinstance(result, dict)
-
-    def test_parse_command_codetab(self):
-        """Test parsing codetab command (alias for partab)."""
-        output = "1 | temp | K"
-        result = parse_cdo_output("codetab data.nc", output)
-        assert isinstance(result, list)
+    @pytest.mark.parametrize(
+        "command,output,expected_type",
+        [
+            # Operator parameters like griddes,123 are stripped
+            ("griddes,123 data.nc", "gridtype = lonlat", dict),
+            ("-griddes data.nc", "gridtype = lonlat", dict),
+            ("GRIDDES data.nc", "gridtype = lonlat", dict),
+            ("sinfo data.nc", "File format: NetCDF", dict),
+            ("sinfon data.nc", "File format: NetCDF", dict),
+            ("sinfov data.nc", "File format: NetCDF", dict),
+            ("infon data.nc", "File format: NetCDF", dict),
+            ("griddes2 data.nc", "gridtype = lonlat", dict),
+            # codetab is an alias for partab
+            ("codetab data.nc", "1 | temp | K", list),
+        ],
+    )
+    def test_parse_command_variants(self, command, output, expected_type):
+        """Test operator extraction for prefixes, parameters, case and aliases."""
+        result = parse_cdo_output(command, output)
+        assert isinstance(result, expected_type)
 
     def test_parse_command_vct2(self):
         """Test parsing vct2 command."""
@@ -1167,3 +1427,29 @@ class TestParseCdoOutputEdgeCases:
         result = parse_cdo_output("vct2 data.nc", output)
         assert isinstance(result, dict)
         assert "vct" in result
+
+
+class TestParseLines:
+    """Tests for feeding parsers line by line via parse_lines."""
+
+    def test_griddes_from_stream(self, griddes_parser):
+        """Test that parse_lines on a text stream matches parse."""
+        output = "gridtype = lonlat\ngridsize = 100\nxvals = 1 2 3\n"
+        assert griddes_parser.parse_lines(io.StringIO(output)) == griddes_parser.parse(
+            output
+        )
+
+    def test_sinfo_from_generator(self, sinfo_parser):
+        """Test that SinfoParser consumes a generator of lines."""
+        output = """File format: NetCDF
+   -1 : Date     Time   Level Gridsize    Num    Dtype : Parameter name
+    1 : 2020-01-01 00:00:00       0   518400      1  F64    : tas"""
+        result = sinfo_parser.parse_lines(line for line in output.splitlines())
+        assert result == sinfo_parser.parse(output)
+        assert result["variables"][0]["name"] == "tas"
+
+    def test_partab_from_stream(self, partab_parser):
+        """Test that PartabParser detects the separator on a stream."""
+        output = "1 | temp | K\n2 | pres | Pa\n"
+        result = partab_parser.parse_lines(io.StringIO(output))
+        assert [p["name"] for p in result] == ["temp", "pres"]